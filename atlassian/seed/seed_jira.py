@@ -4,15 +4,150 @@
 
 import argparse
 import datetime
+import email.utils
 import hashlib
 import json
 import os
+import queue
 import random
+import sqlite3
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 
+# Jira Cloud accepts at most 50 entries per POST /rest/api/3/issue/bulk.
+JIRA_BULK_LIMIT = 50
+# Page size for the seeded-issue prefetch (the search endpoint caps field queries at 100).
+PREFETCH_PAGE_SIZE = 100
+# Threads paging per-project prefetch shards, independent of --workers.
+PREFETCH_WORKERS = 8
+# Stored issues spot-checked against Jira before the local state store is trusted.
+STATE_SAMPLE_SIZE = 20
+# Bulk create calls made for one batch before its remaining elements are given up.
+BULK_CREATE_ATTEMPTS = 3
+# Generated payloads buffered ahead of the batch writer, in multiples of --batch-size.
+WRITER_QUEUE_BATCHES = 4
+# Longest workflow walk apply_transitions will attempt for a single issue.
+MAX_TRANSITION_HOPS = 6
+# Intermediate statuses a walk may pass through on its way to the target, in
+# order of preference; detours such as Blocked are never taken.
+TRANSITION_HOPS = ("In Progress", "In Review")
+# Jira status categories in workflow order; walks never move to an earlier one.
+STATUS_CATEGORY_RANK = {"new": 0, "indeterminate": 1, "done": 2}
+# Attempts per API call; only rate limits, server errors and network errors retry.
+API_ATTEMPTS = 3
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# Jittered exponential backoff bounds in seconds.
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+
+def parse_retry_after(value):
+    """Return a ``Retry-After`` header as seconds (delta or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket whose rate adapts with AIMD.
+
+    The bucket refills at ``rate`` tokens per second, never above ``max_rate``.
+    Every successful request raises the rate additively; a throttling signal
+    from Jira halves it and, when ``Retry-After`` is given, pauses all callers
+    until that moment. Concurrent requests throttled by the same burst would
+    otherwise each halve the rate, so after a decrease further signals are
+    ignored for one cooldown window (the ``Retry-After`` delay or one refill
+    interval, whichever is longer).
+    """
+
+    def __init__(self, max_rate, min_rate=0.5):
+        if max_rate <= 0:
+            raise ValueError("--max-rps must be greater than 0")
+        self.max_rate = float(max_rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.rate = self.max_rate
+        self.increase = max(0.05, self.max_rate / 20.0)
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.cooldown_until = 0.0
+        self.lock = threading.Lock()
+        self.stats = {
+            "granted": 0,
+            "throttled": 0,
+            "retries": 0,
+            "wait_seconds": 0.0,
+            "lowest_rps": self.rate,
+        }
+
+    def _refill(self, now):
+        capacity = max(1.0, self.rate)
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = max(0.0, self.blocked_until - now)
+                if wait == 0.0 and self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    self.stats["granted"] += 1
+                    return
+                if wait == 0.0:
+                    wait = (1.0 - self.tokens) / self.rate
+                self.stats["wait_seconds"] += wait
+            time.sleep(wait)
+
+    def on_success(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after=None):
+        with self.lock:
+            now = time.monotonic()
+            self.stats["throttled"] += 1
+            self.tokens = 0.0
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+            if now < self.cooldown_until:
+                return
+            self.rate = max(self.min_rate, self.rate / 2.0)
+            self.stats["lowest_rps"] = min(self.stats["lowest_rps"], self.rate)
+            self.cooldown_until = now + max(retry_after or 0.0, 1.0 / self.rate)
+
+    def on_retry(self):
+        with self.lock:
+            self.stats["retries"] += 1
+
+    def summary(self):
+        with self.lock:
+            return {
+                "max_rps": self.max_rate,
+                "current_rps": round(self.rate, 3),
+                "lowest_rps": round(self.stats["lowest_rps"], 3),
+                "granted": self.stats["granted"],
+                "throttled": self.stats["throttled"],
+                "retries": self.stats["retries"],
+                "wait_seconds": round(self.stats["wait_seconds"], 3),
+            }
+
 
 class JiraClient:
     """
@@ -22,48 +157,144 @@ class JiraClient:
     - When dry_run=True, write operations (POST, PUT) return stubbed responses.
     - Read operations (GET) still execute to validate connectivity and fetch metadata
       like issue types, boards, and transitions.
+
+    All requests share one pooled keep-alive ``requests.Session`` that is created
+    lazily on first use, so a run reuses TLS connections instead of opening a new
+    one per call. Calls pass through an adaptive ``RateLimiter``; 429 responses
+    honour ``Retry-After``, other retryable failures back off exponentially with
+    jitter, and remaining 4xx errors are returned immediately without retrying.
     """
-    def __init__(self, url, user, token, dry_run=False):
+    def __init__(self, url, user, token, dry_run=False, pool_size=10, max_rps=10.0):
         self.url = url.rstrip("/")
         self.user = user
         self.token = token
         self.dry_run = dry_run
+        self.pool_size = max(1, int(pool_size))
         self._issue_types = None
+        self._session = None
+        self._request_count = 0
+        self._stats_lock = threading.Lock()
+        self.limiter = RateLimiter(max_rps)
 
     def log(self, msg):
         print(f"[Seeder] {msg}")
 
-    def api_request(self, method, endpoint, data=None, params=None):
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from requests.auth import HTTPBasicAuth
+
+            session = requests.Session()
+            session.auth = HTTPBasicAuth(self.user, self.token)
+            session.headers.update(
+                {
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                    "Connection": "keep-alive",
+                }
+            )
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size, pool_maxsize=self.pool_size
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def connection_stats(self):
+        """
+        Summarize HTTP connection reuse for the manifest.
+
+        ``connections_opened`` is read from the urllib3 pools behind the session;
+        every request beyond that count was served over a kept-alive connection.
+        """
+        opened = 0
+        if self._session is not None:
+            seen = set()
+            for adapter in self._session.adapters.values():
+                if id(adapter) in seen:
+                    continue
+                seen.add(id(adapter))
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    opened += getattr(pool, "num_connections", 0) if pool else 0
+        return {
+            "pool_size": self.pool_size,
+            "requests": self._request_count,
+            "connections_opened": opened,
+            "connections_reused": max(0, self._request_count - opened),
+        }
+
+    def api_request(
+        self, method, endpoint, data=None, params=None, error_statuses=(), replay=True
+    ):
+        """
+        Send one API call with rate limiting and retries; return the parsed body.
+
+        Returns None when the call fails. Responses whose status is listed in
+        ``error_statuses`` are not failures: their parsed error body is returned
+        so the caller can inspect it. With ``replay=False`` only rate limits are
+        retried: after a network error or server error Jira may already have
+        applied a non-idempotent call, so it is not sent again.
+        """
         if self.dry_run:
             return {}
 
         import requests
-        from requests.auth import HTTPBasicAuth
 
-        headers = {"Accept": "application/json", "Content-Type": "application/json"}
         url = f"{self.url}{endpoint}"
 
-        for attempt in range(3):
+        for attempt in range(API_ATTEMPTS):
+            self.limiter.acquire()
+            retry_after = None
             try:
-                resp = requests.request(
+                with self._stats_lock:
+                    self._request_count += 1
+                resp = self.session.request(
                     method,
                     url,
                     data=json.dumps(data) if data else None,
                     params=params,
-                    headers=headers,
-                    auth=HTTPBasicAuth(self.user, self.token),
                     # Timeout increased from 30s to 40s to accommodate slower Jira Cloud API responses
                     timeout=40,
                 )
+            except requests.RequestException as exc:
+                self.log(f"Exception (attempt {attempt + 1}/{API_ATTEMPTS}): {exc}")
+                if not replay:
+                    return None
+            else:
                 if resp.status_code in [200, 201, 204]:
+                    self.limiter.on_success()
                     return resp.json() if resp.content else {}
+                if resp.status_code in error_statuses:
+                    try:
+                        return resp.json() if resp.content else {}
+                    except ValueError:
+                        return {}
                 self.log(
-                    f"Error {resp.status_code} on {method} {endpoint} (attempt {attempt + 1}/3): {resp.text}"
+                    f"Error {resp.status_code} on {method} {endpoint} "
+                    f"(attempt {attempt + 1}/{API_ATTEMPTS}): {resp.text}"
                 )
-            except requests.RequestException as exc:
-                self.log(f"Exception (attempt {attempt + 1}/3): {exc}")
-
-            time.sleep(1)
+                if resp.status_code == 429:
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                    self.limiter.on_throttle(retry_after)
+                elif resp.status_code not in RETRYABLE_STATUSES or not replay:
+                    return None
+
+            if attempt + 1 < API_ATTEMPTS:
+                self.limiter.on_retry()
+                if retry_after is None:
+                    # Full jitter; independent of the seeded generators on purpose.
+                    delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)
+                    time.sleep(random.uniform(0, delay))  # nosec B311
 
         return None
 
@@ -76,14 +307,24 @@ class JiraClient:
                 self._issue_types = [i.get("name") for i in data if i.get("name")]
         return self._issue_types
 
-    def search(self, jql, fields=None, max_results=100, start_at=0):
-        params = {
+    def search_jql(self, jql, fields=None, max_results=100, next_page_token=None):
+        """One page of the token-paginated ``/rest/api/3/search/jql`` endpoint."""
+        payload = {
             "jql": jql,
-            "startAt": start_at,
             "maxResults": max_results,
-            "fields": ",".join(fields or ["labels"]),
+            "fields": fields or ["labels"],
         }
-        return self.api_request("GET", "/rest/api/3/search", params=params)
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        return self.api_request("POST", "/rest/api/3/search/jql", payload)
+
+    def approximate_count(self, jql):
+        data = self.api_request(
+            "POST", "/rest/api/3/search/approximate-count", {"jql": jql}
+        )
+        if not data:
+            return None
+        return data.get("count")
 
     def create_issue(self, payload):
         return self.api_request("POST", "/rest/api/3/issue", payload)
@@ -91,7 +332,15 @@ class JiraClient:
     def create_issues_bulk(self, payloads):
         if self.dry_run:
             return {"issues": [{"id": f"dry-{i}", "key": f"DRY-{i}"} for i in range(len(payloads))]}
-        return self.api_request("POST", "/rest/api/3/issue/bulk", {"issueUpdates": payloads})
+        # A bulk create whose every element is rejected answers 400 with the
+        # same per-element errors body a partial failure carries.
+        return self.api_request(
+            "POST",
+            "/rest/api/3/issue/bulk",
+            {"issueUpdates": payloads},
+            error_statuses=(400,),
+            replay=False,
+        )
 
     def set_issue_property(self, issue_id_or_key, property_key, value):
         return self.api_request(
@@ -267,6 +516,35 @@ def adf_text(text):
     }
 
 
+def seeded_jql(project_keys):
+    projects = ", ".join(f'"{key}"' for key in project_keys)
+    return f'project in ({projects}) AND labels = "seeded"'
+
+
+def bulk_error_messages(error):
+    """Flatten a bulk create ``errors[]`` entry into a list of readable messages."""
+    details = error.get("elementErrors", {}) or {}
+    messages = list(details.get("errorMessages", []) or [])
+    for field, message in (details.get("errors", {}) or {}).items():
+        messages.append(f"{field}: {message}")
+    return messages
+
+
+def edge_rank(edge, current_rank):
+    """Status category rank an ``[id, to_name, to_category]`` edge leads to."""
+    category = edge[2] if len(edge) > 2 else None
+    return STATUS_CATEGORY_RANK.get(category, current_rank)
+
+
+def is_forward_hop(edge, current_rank):
+    """True if a walk may pass through the status ``edge`` leads to."""
+    rank = edge_rank(edge, current_rank)
+    return (
+        edge[1].lower() in {hop.lower() for hop in TRANSITION_HOPS}
+        and current_rank <= rank < STATUS_CATEGORY_RANK["done"]
+    )
+
+
 def stable_hash(value, length=12):
     digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
     return digest[:length]
@@ -277,6 +555,24 @@ def utcnow_naive():
     return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
 
 
+def parse_jira_datetime(value):
+    """Parse a Jira ISO-8601 timestamp into a naive UTC datetime, or None."""
+    if not value:
+        return None
+    # Jira typically returns ISO-8601 strings, sometimes with a trailing 'Z'
+    text = value
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        dt = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    # Normalize to naive UTC to match sprint_map datetimes
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return dt
+
+
 def month_key(dt):
     return dt.strftime("%Y-%m")
 
@@ -303,6 +599,199 @@ def dwell_bucket(days):
     return "14d+"
 
 
+class TransitionCache:
+    """
+    Workflow transitions learned per (project, issue type, status).
+
+    Newly created issues of the same project and type always start in the same
+    workflow status, recorded as ``CREATED_STATUS``. Every status reached by a
+    transition is keyed by its name, so once a path has been walked it can be
+    replayed for later issues without calling ``get_transitions``. Edges are
+    stored as ``[id, to_name, to_category]``. The map is persisted as JSON keyed
+    by Jira URL so later runs start warm.
+    """
+
+    CREATED_STATUS = "<created>"
+
+    def __init__(self, path, url):
+        self.path = path
+        self.url = url
+        self.graph = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        graph = data.get(self.url, {}) if isinstance(data, dict) else {}
+        self.graph = graph if isinstance(graph, dict) else {}
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        data = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as handle:
+                    data = json.load(handle)
+            except (OSError, ValueError):
+                data = {}
+        with self.lock:
+            data[self.url] = self.graph
+            self.dirty = False
+        with open(self.path, "w") as handle:
+            json.dump(data, handle, indent=2, sort_keys=True)
+
+    def edges(self, project_key, issue_type, status):
+        with self.lock:
+            return self.graph.get(project_key, {}).get(issue_type, {}).get(status)
+
+    def learn(self, project_key, issue_type, status, transitions):
+        edges = []
+        for t in transitions:
+            to = t.get("to", {}) or {}
+            to_name = to.get("name")
+            category = (to.get("statusCategory", {}) or {}).get("key")
+            if t.get("id") and to_name:
+                edges.append([t.get("id"), to_name, category])
+        with self.lock:
+            by_type = self.graph.setdefault(project_key, {}).setdefault(issue_type, {})
+            by_type[status] = edges
+            self.dirty = True
+        return edges
+
+    def forget(self, project_key, issue_type, status):
+        with self.lock:
+            by_type = self.graph.get(project_key, {}).get(issue_type, {})
+            if by_type.pop(status, None) is not None:
+                self.dirty = True
+
+    def find_path(self, project_key, issue_type, status, target_status, rank=0):
+        """
+        Breadth-first search over forward edges; returns [[id, to], ...] or None.
+
+        ``rank`` is the status category rank of ``status``.
+        """
+        target = target_status.lower()
+        with self.lock:
+            by_type = self.graph.get(project_key, {}).get(issue_type, {})
+            queue = [(status, rank, [])]
+            seen = {status}
+            while queue:
+                current, current_rank, path = queue.pop(0)
+                for edge in by_type.get(current, []) or []:
+                    to_name = edge[1]
+                    to_rank = edge_rank(edge, current_rank)
+                    if to_name in seen or to_rank < current_rank:
+                        continue
+                    step = path + [[edge[0], to_name]]
+                    if to_name.lower() == target:
+                        return step
+                    if not is_forward_hop(edge, current_rank):
+                        continue
+                    seen.add(to_name)
+                    queue.append((to_name, to_rank, step))
+        return None
+
+
+class SeedStateStore:
+    """
+    SQLite record of every issue the seeder created, keyed by Jira URL and external id.
+
+    Lets re-runs skip the seeded-issue scan when the store agrees with Jira's
+    count, and resolve follow-up link targets created by earlier runs.
+    """
+
+    def __init__(self, path, url):
+        self.path = path
+        self.url = url
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seeded_issues (
+                jira_url TEXT NOT NULL,
+                external_id TEXT NOT NULL,
+                issue_key TEXT NOT NULL,
+                project_key TEXT NOT NULL,
+                month_idx INTEGER,
+                issue_type TEXT,
+                PRIMARY KEY (jira_url, external_id)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def record_many(self, rows):
+        """Upsert ``(external_id, issue_key, project_key, month_idx, issue_type)`` rows."""
+        if not rows:
+            return
+        with self.lock:
+            self.conn.executemany(
+                """
+                INSERT INTO seeded_issues
+                    (jira_url, external_id, issue_key, project_key, month_idx, issue_type)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (jira_url, external_id) DO UPDATE SET
+                    issue_key = excluded.issue_key,
+                    project_key = excluded.project_key,
+                    month_idx = COALESCE(excluded.month_idx, seeded_issues.month_idx),
+                    issue_type = COALESCE(excluded.issue_type, seeded_issues.issue_type)
+                """,
+                [(self.url, *row) for row in rows],
+            )
+            self.conn.commit()
+
+    def issues_by_project(self, project_keys):
+        """Return ``{project_key: {external_id: issue_key}}`` for ``project_keys``."""
+        found = defaultdict(dict)
+        if not project_keys:
+            return found
+        marks = ", ".join("?" for _ in project_keys)
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT project_key, external_id, issue_key FROM seeded_issues "
+                f"WHERE jira_url = ? AND project_key IN ({marks})",  # nosec B608
+                [self.url, *project_keys],
+            )
+            for project_key, external_id, issue_key in cursor:
+                found[project_key][external_id] = issue_key
+        return found
+
+    def reconcile(self, project_keys, found):
+        """Make the store match a full scan: add what Jira has, drop what it lacks."""
+        known = self.issues_by_project(project_keys)
+        stale = [
+            (self.url, external_id)
+            for project_key in project_keys
+            for external_id in known.get(project_key, {})
+            if external_id not in found.get(project_key, {})
+        ]
+        with self.lock:
+            self.conn.executemany(
+                "DELETE FROM seeded_issues WHERE jira_url = ? AND external_id = ?", stale
+            )
+            self.conn.commit()
+        self.record_many(
+            [
+                (external_id, issue_key, project_key, None, None)
+                for project_key, issues in found.items()
+                for external_id, issue_key in issues.items()
+            ]
+        )
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
 class JiraSeeder:
     def __init__(self, args):
         self.args = args
@@ -315,7 +804,14 @@ class JiraSeeder:
         # Using deterministic seeding intentionally for reproducible demo data generation
         self.rng = random.Random(seed_hash)  # nosec B311
 
-        self.client = JiraClient(args.url, args.user, args.token, dry_run=args.dry_run)
+        self.client = JiraClient(
+            args.url,
+            args.user,
+            args.token,
+            dry_run=args.dry_run,
+            pool_size=max(args.http_pool_size, args.workers, PREFETCH_WORKERS),
+            max_rps=args.max_rps,
+        )
         self.issue_types = set(self.client.get_issue_types())
 
         self.existing_ids = defaultdict(set)
@@ -336,9 +832,42 @@ class JiraSeeder:
             "dwell": {"histogram": defaultdict(lambda: defaultdict(int))},
             "hotspots": {"service_counts": defaultdict(int)},
             "dependencies": {"cross_project_epics": 0},
+            "transitions": {"lookups": 0, "cache_hits": 0, "applied": 0},
+            "sprint_sync": {
+                "created": 0,
+                "reused": 0,
+                "date_updates": 0,
+                "state_updates": 0,
+            },
+            "bulk_create": {
+                "elements": 0,
+                "created": 0,
+                "failed": 0,
+                "retried_calls": 0,
+                "batches": [],
+            },
         }
+        self.stats_lock = threading.Lock()
+        state_path = args.state_db or os.path.join(
+            os.path.dirname(os.path.abspath(args.manifest)), "seed_state.sqlite3"
+        )
+        self.state = None if args.dry_run else SeedStateStore(state_path, self.client.url)
+        self.manifest["state_store"] = {
+            "path": None if args.dry_run else state_path,
+            "trusted": False,
+            "recorded": 0,
+        }
+        cache_path = args.transition_cache or os.path.join(
+            os.path.dirname(os.path.abspath(args.manifest)), "transition_cache.json"
+        )
+        self.transition_cache = TransitionCache(
+            None if args.dry_run else cache_path, self.client.url
+        )
 
-        self.created_issues = []
+        self.pending_structure = []
+        self.issue_queue = None
+        self.writer = None
+        self.writer_error = None
         self.epic_keys = defaultdict(list)
         self.initiative_keys = defaultdict(list)
         self.incident_keys = []
@@ -346,6 +875,7 @@ class JiraSeeder:
         self.issues_by_project_month = defaultdict(lambda: defaultdict(list))
         self.followup_specs = []
         self.sprints_by_project = {}
+        self.sprint_states = {}
         self.team_primary_project = {
             t["id"]: t["primary_project"] for t in self.story.get("teams", [])
         }
@@ -414,30 +944,132 @@ class JiraSeeder:
                     self.assignees.append(acc_id)
         self.log(f"Resolved {len(self.assignees)} assignees")
 
-    def prefetch_existing(self, project_key):
-        start_at = 0
-        found = set()
+    def prefetch_existing(self, project_keys):
+        """
+        Load the extid labels and keys of every seeded issue in ``project_keys``.
+
+        When the local state store holds exactly as many issues as Jira's
+        approximate count for the seeded JQL and passes ``state_store_matches``,
+        the store is trusted and nothing is scanned. Otherwise one cross-project ``project in (...)`` JQL runs on the
+        token-paginated search endpoint, requesting only ``labels``, and the
+        store is reconciled with the result. Token pages can only be walked in
+        order, so when more than one page is expected the same query is split
+        into per-project shards paginated concurrently on up to
+        ``PREFETCH_WORKERS`` threads.
+        """
+        if not project_keys:
+            return
+        total = self.client.approximate_count(seeded_jql(project_keys))
+        known = self.state.issues_by_project(project_keys) if self.state else {}
+        known_count = sum(len(issues) for issues in known.values())
+        if (
+            self.state is not None
+            and total is not None
+            and known_count == total
+            and self.state_store_matches(project_keys, known)
+        ):
+            self.log(f"Trusting local state store for {known_count} seeded issues")
+            self.manifest["state_store"]["trusted"] = True
+            self.load_existing(project_keys, known)
+            return
+
+        if total is not None and total <= PREFETCH_PAGE_SIZE:
+            shards = [list(project_keys)]
+        else:
+            shards = [[key] for key in project_keys]
+
+        if len(shards) > 1:
+            workers = min(len(shards), PREFETCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                pages = list(pool.map(self.fetch_seeded_issues, shards))
+        else:
+            pages = [self.fetch_seeded_issues(shard) for shard in shards]
+
+        found = defaultdict(dict)
+        for shard_found in pages:
+            for project_key, issues in shard_found.items():
+                found[project_key].update(issues)
+        if self.state is not None:
+            self.state.reconcile(project_keys, found)
+        self.load_existing(project_keys, found)
+
+    def state_store_matches(self, project_keys, known):
+        """
+        Spot-check the state store against Jira before it is trusted.
+
+        Equal counts do not prove equal sets, so up to ``STATE_SAMPLE_SIZE``
+        stored issues spread across the store must still exist with their extid
+        label, and the most recently created seeded issue must be in the store.
+        """
+        stored = sorted(
+            (issue_key, ext)
+            for issues in known.values()
+            for ext, issue_key in issues.items()
+        )
+        if not stored:
+            return True
+        step = max(1, len(stored) // STATE_SAMPLE_SIZE)
+        sample = stored[::step][:STATE_SAMPLE_SIZE]
+        keys = ", ".join(issue_key for issue_key, _ in sample)
+        data = self.client.search_jql(
+            f'key in ({keys}) AND labels = "seeded"', max_results=len(sample)
+        )
+        if not data or "issues" not in data:
+            self.log("State store sample could not be checked; scanning Jira")
+            return False
+        labels_by_key = {
+            issue.get("key"): set(issue.get("fields", {}).get("labels", []) or [])
+            for issue in data["issues"]
+        }
+        for issue_key, ext in sample:
+            if f"extid-{ext}" not in labels_by_key.get(issue_key, ()):
+                self.log(f"State store entry {issue_key} no longer matches Jira; scanning Jira")
+                return False
+        data = self.client.search_jql(
+            f"{seeded_jql(project_keys)} ORDER BY created DESC", max_results=1
+        )
+        if not data or "issues" not in data:
+            self.log("Newest seeded issue could not be checked; scanning Jira")
+            return False
+        stored_keys = {issue_key for issue_key, _ in stored}
+        for issue in data["issues"]:
+            if issue.get("key") not in stored_keys:
+                self.log(f"Newest seeded issue {issue.get('key')} is not in the state store; scanning Jira")
+                return False
+        return True
+
+    def load_existing(self, project_keys, found):
+        for project_key in project_keys:
+            issues = found.get(project_key, {})
+            self.existing_ids[project_key] = {f"extid-{ext}" for ext in issues}
+            self.issue_key_by_external_id.update(issues)
+            if issues:
+                self.log(f"Found {len(issues)} existing seeded issues in {project_key}")
+
+    def fetch_seeded_issues(self, project_keys):
+        """Page through the seeded JQL; returns ``{project_key: {external_id: key}}``."""
+        found = defaultdict(dict)
+        token = None
         while True:
-            data = self.client.search(
-                f'project = {project_key} AND labels = "seeded"',
+            data = self.client.search_jql(
+                seeded_jql(project_keys),
                 fields=["labels"],
-                max_results=100,
-                start_at=start_at,
+                max_results=PREFETCH_PAGE_SIZE,
+                next_page_token=token,
             )
             if not data or "issues" not in data:
                 break
-            issues = data.get("issues", [])
-            for issue in issues:
+            for issue in data.get("issues", []):
+                issue_key = issue.get("key") or ""
+                project_key = issue_key.rsplit("-", 1)[0]
                 labels = issue.get("fields", {}).get("labels", []) or []
                 for label in labels:
                     if label.startswith("extid-"):
-                        found.add(label)
-            if start_at + 100 >= data.get("total", 0):
+                        found[project_key][label[len("extid-"):]] = issue_key
+            token = data.get("nextPageToken")
+            if not token or data.get("isLast"):
                 break
-            start_at += 100
-        self.existing_ids[project_key] = found
-        if found:
-            self.log(f"Found {len(found)} existing seeded issues in {project_key}")
+        return found
 
     def ensure_issue_type(self, desired):
         if desired in self.issue_types:
@@ -497,43 +1129,226 @@ class JiraSeeder:
         self.maybe_assign(fields)
         return {"fields": fields}
 
+    def issue_create_payload(self, fields, meta=None):
+        """
+        Build an ``issueUpdates`` entry carrying ``seed_meta`` as an inline property.
+
+        An empty ``meta`` is still sent, so every seeded issue has the property.
+        """
+        payload = {"fields": fields}
+        if meta is not None:
+            payload["properties"] = [{"key": "seed_meta", "value": meta}]
+        return payload
+
+    def bulk_create(self, payloads):
+        """
+        POST one bulk create and align the response with ``payloads``.
+
+        Jira returns created issues in request order minus the elements listed in
+        ``errors[].failedElementNumber``. Returns ``(response, results, failed)``
+        where ``results[i]`` is the created issue or None and ``failed`` maps each
+        rejected index to its error entry. ``response`` is None when the whole
+        call failed. A 400 without per-element errors rejects every element.
+        """
+        response = self.client.create_issues_bulk(payloads)
+        results = [None] * len(payloads)
+        if not response:
+            return None, results, {}
+        failed = {}
+        element_errors = response.get("errors")
+        for error in element_errors if isinstance(element_errors, list) else []:
+            index = error.get("failedElementNumber")
+            if isinstance(index, int) and 0 <= index < len(payloads):
+                failed[index] = error
+        if "issues" not in response and not failed:
+            rejection = {"status": 400, "elementErrors": response}
+            return response, results, {i: rejection for i in range(len(payloads))}
+        succeeded = [i for i in range(len(payloads)) if i not in failed]
+        issues = response.get("issues", []) or []
+        if len(issues) != len(succeeded):
+            # Without a one-to-one match any key could belong to any element, so
+            # nothing is mapped rather than risking a corrupted extid -> key map.
+            self.log(
+                f"Bulk create returned {len(issues)} issues for {len(succeeded)} "
+                "accepted elements; skipping key mapping for this call"
+            )
+            return response, results, {}
+        for index, issue in zip(succeeded, issues):
+            if issue.get("key"):
+                results[index] = issue
+        return response, results, failed
+
     def create_issues(self, payloads):
+        """
+        Bulk create ``payloads`` and return one entry per payload (None if not created).
+
+        Payload lists longer than ``JIRA_BULK_LIMIT`` are split into several calls.
+
+        Only failed elements are retried, with exponential backoff, for up to
+        ``BULK_CREATE_ATTEMPTS`` calls. A call that got no answer is never
+        resent, since Jira may have committed it; its pending elements are
+        counted as failed and a re-run's prefetch finds any that were created.
+        Element rate-limit and server errors retry the element as is; other
+        rejections of an element carrying inline properties retry it once
+        without them and flag the result ``needs_property`` so the caller falls
+        back to a property PUT. Each batch outcome is added to the manifest.
+        """
         if not payloads:
             return []
-        response = self.client.create_issues_bulk(payloads)
-        issues = response.get("issues", []) if response else []
-        created = []
-        for payload, issue in zip(payloads, issues):
-            key = issue.get("key")
-            if key:
-                created.append({"key": key, "fields": payload.get("fields", {})})
+        if len(payloads) > JIRA_BULK_LIMIT:
+            created = []
+            for start in range(0, len(payloads), JIRA_BULK_LIMIT):
+                created.extend(self.create_issues(payloads[start:start + JIRA_BULK_LIMIT]))
+            return created
+
+        created = [None] * len(payloads)
+        outgoing = {index: payload for index, payload in enumerate(payloads)}
+        errors = {}
+        attempts = 0
+        while outgoing and attempts < BULK_CREATE_ATTEMPTS:
+            if attempts:
+                time.sleep(2 ** (attempts - 1))
+            attempts += 1
+            indices = sorted(outgoing)
+            response, results, failed = self.bulk_create([outgoing[i] for i in indices])
+            retry = {}
+            for position, index in enumerate(indices):
+                payload = outgoing[index]
+                issue = results[position]
+                if issue:
+                    created[index] = {
+                        "key": issue.get("key"),
+                        "fields": payload.get("fields", {}),
+                        "needs_property": "properties" not in payload
+                        and "properties" in payloads[index],
+                    }
+                    errors.pop(index, None)
+                    continue
+                if response is None:
+                    errors[index] = {"status": None, "messages": ["no response"]}
+                    continue
+                if position not in failed:
+                    continue
+                error = failed[position]
+                status = error.get("status")
+                errors[index] = {"status": status, "messages": bulk_error_messages(error)}
+                if status == 429 or (isinstance(status, int) and status >= 500):
+                    retry[index] = payload
+                elif payload.get("properties"):
+                    retry[index] = {"fields": payload["fields"]}
+            if response is None:
+                self.log(
+                    f"Bulk create of {len(indices)} elements got no response; "
+                    "not resending"
+                )
+            if retry:
+                self.log(f"Retrying {len(retry)} of {len(indices)} bulk create elements")
+            outgoing = retry
+
+        self.record_bulk_result(len(payloads), created, attempts, errors)
         return created
 
-    def apply_transitions(self, issue_key, target_status):
+    def record_bulk_result(self, size, created, attempts, errors):
+        created_count = sum(1 for item in created if item)
+        failures = [
+            {
+                "element": index,
+                **errors.get(index, {"status": None, "messages": ["no key returned"]}),
+            }
+            for index, item in enumerate(created)
+            if item is None
+        ]
+        stats = self.manifest["bulk_create"]
+        stats["batches"].append(
+            {
+                "size": size,
+                "created": created_count,
+                "failed": len(failures),
+                "attempts": attempts,
+                "errors": failures,
+            }
+        )
+        stats["elements"] += size
+        stats["created"] += created_count
+        stats["failed"] += len(failures)
+        stats["retried_calls"] += max(0, attempts - 1)
+
+    def apply_transitions(self, issue_key, target_status, project_key, issue_type):
+        """
+        Walk a new issue to ``target_status``, possibly over several hops.
+
+        Known paths are replayed straight from the transition cache. Otherwise
+        the walk asks Jira for the transitions out of the current status, caches
+        them, and steps forward to the most preferred ``TRANSITION_HOPS`` status
+        it has not visited yet. Every transition stays in the issue history, so
+        when no forward step exists the issue is left where it is.
+        """
         if not self.args.enable_transitions:
             return
-        transitions = self.client.get_transitions(issue_key)
-        if not transitions:
-            return
-        desired = None
-        for t in transitions.get("transitions", []):
-            if t.get("to", {}).get("name", "").lower() == target_status.lower():
-                desired = t
-                break
-        if desired:
-            self.client.transition_issue(issue_key, desired.get("id"))
+        cache = self.transition_cache
+        status = TransitionCache.CREATED_STATUS
+        rank = STATUS_CATEGORY_RANK["new"]
+        visited = {status}
+        looked_up = False
+        for _ in range(MAX_TRANSITION_HOPS):
+            path = cache.find_path(project_key, issue_type, status, target_status, rank)
+            if path:
+                if not looked_up:
+                    self.count("transitions", "cache_hits")
+                for transition_id, to_name in path:
+                    if self.client.transition_issue(issue_key, transition_id) is None:
+                        # The cached edge is stale; relearn it on the next issue.
+                        cache.forget(project_key, issue_type, status)
+                        return
+                    self.count("transitions", "applied")
+                    status = to_name
+                return
+
+            edges = cache.edges(project_key, issue_type, status)
+            if edges is None:
+                transitions = self.client.get_transitions(issue_key)
+                if not transitions:
+                    return
+                self.count("transitions", "lookups")
+                edges = cache.learn(
+                    project_key, issue_type, status, transitions.get("transitions", [])
+                )
+                looked_up = True
+                if cache.find_path(
+                    project_key, issue_type, status, target_status, rank
+                ):
+                    continue
 
-    def maybe_comment(self, issue_key, arc_name):
+            hops = [e for e in edges if e[1] not in visited and is_forward_hop(e, rank)]
+            if not hops:
+                return
+            preference = [hop.lower() for hop in TRANSITION_HOPS]
+            next_edge = min(hops, key=lambda e: preference.index(e[1].lower()))
+            if self.client.transition_issue(issue_key, next_edge[0]) is None:
+                cache.forget(project_key, issue_type, status)
+                return
+            self.count("transitions", "applied")
+            status = next_edge[1]
+            rank = edge_rank(next_edge, rank)
+            visited.add(status)
+            looked_up = False
+
+    def count(self, section, counter, amount=1):
+        """Thread-safe increment of a manifest counter updated from worker threads."""
+        with self.stats_lock:
+            self.manifest[section][counter] += amount
+
+    def plan_comment(self, arc_name):
         if not self.args.enable_comments:
-            return
+            return None
         if self.rng.random() > 0.25:
-            return
-        body = adf_text(f"Seeder note: progress update during {arc_name} phase.")
-        self.client.add_comment(issue_key, body)
+            return None
+        return adf_text(f"Seeder note: progress update during {arc_name} phase.")
 
     def ensure_epics_and_initiatives(self, project_key, team_id):
-        epics = []
-        initiatives = []
+        """Plan the project's initiatives and epics; create_structure_issues writes them."""
+        self.epic_keys[project_key] = []
+        self.initiative_keys[project_key] = []
         for year in range(2):
             for idx in range(2):
                 seed = f"{project_key}-init-{year}-{idx}"
@@ -559,24 +1374,25 @@ class JiraSeeder:
                     "Seeded initiative for portfolio tracking.",
                     labels,
                 )
-                issue = self.client.create_issue(payload)
-                if issue and issue.get("key"):
-                    self.client.set_issue_property(
-                        issue.get("key"),
-                        "seed_meta",
-                        {
-                            "external_id": ext,
-                            "created_at": created_at.isoformat() + "Z",
-                            "team_id": team_id,
-                            "issue_type": issue_type,
-                            "seed_type": manifest_type,
-                            "project_key": project_key,
-                            "arc": "Launch",
-                            "month_idx": month_idx,
-                        },
-                    )
-                    initiatives.append(issue.get("key"))
-                    self.existing_ids[project_key].add(label)
+                meta = {
+                    "external_id": ext,
+                    "created_at": created_at.isoformat() + "Z",
+                    "team_id": team_id,
+                    "issue_type": issue_type,
+                    "seed_type": manifest_type,
+                    "project_key": project_key,
+                    "arc": "Launch",
+                    "month_idx": month_idx,
+                }
+                self.pending_structure.append(
+                    {
+                        "kind": "initiative",
+                        "project_key": project_key,
+                        "label": label,
+                        "month_idx": month_idx,
+                        "payload": self.issue_create_payload(payload["fields"], meta),
+                    }
+                )
         for quarter in range(8):
             for idx in range(3):
                 seed = f"{project_key}-epic-{quarter}-{idx}"
@@ -602,26 +1418,68 @@ class JiraSeeder:
                     "Seeded epic for roadmap structure.",
                     labels,
                 )
-                issue = self.client.create_issue(payload)
-                if issue and issue.get("key"):
-                    self.client.set_issue_property(
-                        issue.get("key"),
-                        "seed_meta",
-                        {
-                            "external_id": ext,
-                            "created_at": created_at.isoformat() + "Z",
-                            "team_id": team_id,
-                            "issue_type": issue_type,
-                            "seed_type": manifest_type,
-                            "project_key": project_key,
-                            "arc": "Launch",
-                            "month_idx": month_idx,
-                        },
-                    )
-                    epics.append(issue.get("key"))
-                    self.existing_ids[project_key].add(label)
-        self.epic_keys[project_key] = epics
-        self.initiative_keys[project_key] = initiatives
+                meta = {
+                    "external_id": ext,
+                    "created_at": created_at.isoformat() + "Z",
+                    "team_id": team_id,
+                    "issue_type": issue_type,
+                    "seed_type": manifest_type,
+                    "project_key": project_key,
+                    "arc": "Launch",
+                    "month_idx": month_idx,
+                }
+                self.pending_structure.append(
+                    {
+                        "kind": "epic",
+                        "project_key": project_key,
+                        "label": label,
+                        "month_idx": month_idx,
+                        "payload": self.issue_create_payload(payload["fields"], meta),
+                    }
+                )
+
+    def create_structure_issues(self):
+        """
+        Bulk create every planned initiative and epic, packed up to the bulk limit.
+
+        Keys are appended to ``initiative_keys``/``epic_keys`` in planning order;
+        elements Jira rejects are skipped so the remaining keys stay aligned.
+        """
+        pending = self.pending_structure
+        self.pending_structure = []
+        if not pending:
+            return
+        self.log(f"Creating {len(pending)} initiatives and epics")
+        created = self.create_issues([entry["payload"] for entry in pending])
+        rows = []
+        for entry, issue in zip(pending, created):
+            if not issue:
+                self.log(f"Failed to create {entry['kind']} in {entry['project_key']}")
+                continue
+            issue_key = issue["key"]
+            if issue["needs_property"]:
+                for prop in entry["payload"].get("properties", []):
+                    self.client.set_issue_property(issue_key, prop["key"], prop["value"])
+            if entry["kind"] == "initiative":
+                self.initiative_keys[entry["project_key"]].append(issue_key)
+            else:
+                self.epic_keys[entry["project_key"]].append(issue_key)
+            self.existing_ids[entry["project_key"]].add(entry["label"])
+            rows.append(
+                (
+                    entry["label"][len("extid-"):],
+                    issue_key,
+                    entry["project_key"],
+                    entry["month_idx"],
+                    entry["payload"]["fields"]["issuetype"]["name"],
+                )
+            )
+        self.record_state(rows)
+
+    def record_state(self, rows):
+        if self.state is not None:
+            self.state.record_many(rows)
+            self.manifest["state_store"]["recorded"] += len(rows)
 
     def link_epics_cross_project(self, project_keys):
         all_epics = []
@@ -701,7 +1559,7 @@ class JiraSeeder:
                 "arc": arc["name"],
                 "month_idx": month_idx,
             }
-            self.created_issues.append(payload)
+            self.enqueue_issue(payload)
             self.existing_ids[project_key].add(label)
 
         for idx in range(incident_count):
@@ -762,20 +1620,64 @@ class JiraSeeder:
             "severity": severity,
             "month_idx": month_idx,
         }
-        self.created_issues.append(payload)
+        self.enqueue_issue(payload)
         self.existing_ids[incident_project_key].add(label)
 
         return
 
-    def flush_batches(self):
+    def start_batch_writer(self):
+        """
+        Start the thread that drains generated payloads into bulk creates.
+
+        Generation pushes payloads into a bounded queue, so writes begin with the
+        first full batch and memory stays flat however long the history is.
+        """
+        batch_size = max(1, self.args.batch_size)
+        self.issue_queue = queue.Queue(maxsize=batch_size * WRITER_QUEUE_BATCHES)
+        self.writer_error = None
+        self.writer = threading.Thread(
+            target=self.drain_issue_queue, name="jira-batch-writer", daemon=True
+        )
+        self.writer.start()
+
+    def enqueue_issue(self, payload):
+        """
+        Hand a generated payload to the batch writer.
+
+        The comment decision is drawn here, on the generation thread, so the
+        writer never touches ``self.rng`` while generation is still drawing.
+        """
+        payload["_comment"] = self.plan_comment(payload["_seed_meta"].get("arc", ""))
+        self.issue_queue.put(payload)
+
+    def drain_issue_queue(self):
         batch = []
-        for payload in self.created_issues:
+        while True:
+            payload = self.issue_queue.get()
+            if payload is None:
+                break
+            if self.writer_error is not None:
+                # Keep consuming so generation never blocks on a full queue.
+                continue
             batch.append(payload)
             if len(batch) >= self.args.batch_size:
-                self.process_batch(batch)
+                self.write_batch(batch)
                 batch = []
-        if batch:
+        if batch and self.writer_error is None:
+            self.write_batch(batch)
+
+    def write_batch(self, batch):
+        try:
             self.process_batch(batch)
+        except Exception as exc:  # re-raised on the main thread by flush_batches
+            self.writer_error = exc
+
+    def flush_batches(self):
+        """Signal the end of generation and wait for the writer to finish."""
+        self.issue_queue.put(None)
+        self.writer.join()
+        if self.writer_error is not None:
+            raise self.writer_error
 
     def process_batch(self, batch):
         grouped = defaultdict(list)
@@ -783,38 +1685,105 @@ class JiraSeeder:
             project_key = item["fields"]["project"]["key"]
             grouped[project_key].append(item)
 
+        created_items = []
+        rows = []
         for project_key, items in grouped.items():
-            payloads = [{"fields": item["fields"]} for item in items]
+            payloads = [
+                self.issue_create_payload(item["fields"], item.get("_seed_meta", {}))
+                for item in items
+            ]
             created = self.create_issues(payloads)
             for issue_meta, created_issue in zip(items, created):
-                issue_key = created_issue.get("key")
-                if not issue_key:
+                if not created_issue or not created_issue.get("key"):
                     continue
-                meta = issue_meta.get("_seed_meta", {})
+                issue_key = created_issue.get("key")
                 labels = issue_meta.get("fields", {}).get("labels", [])
                 ext_label = next((lbl for lbl in labels if lbl.startswith("extid-")), None)
                 if ext_label:
-                    self.issue_key_by_external_id[ext_label.replace("extid-", "")] = issue_key
-                self.client.set_issue_property(issue_key, "seed_meta", meta)
-                self.maybe_comment(issue_key, meta.get("arc", ""))
-
-                issue_type = issue_meta.get("fields", {}).get("issuetype", {}).get("name", "")
-                if issue_type.lower() == "incident":
-                    target_status = "Resolved"
-                else:
-                    target_status = "Done"
-                self.apply_transitions(issue_key, target_status)
-
-                month_idx = meta.get("month_idx")
-                if isinstance(month_idx, int) and issue_type.lower() in ["story", "task", "bug"]:
-                    self.issues_by_project_month[project_key][month_idx].append(issue_key)
-
-                link_external = issue_meta.get("_link_external_id")
-                link_type = issue_meta.get("_link_type")
-                if link_external and link_type:
-                    target_key = self.issue_key_by_external_id.get(link_external)
-                    if target_key:
-                        self.client.create_issue_link(link_type, issue_key, target_key)
+                    external_id = ext_label.replace("extid-", "")
+                    self.issue_key_by_external_id[external_id] = issue_key
+                    rows.append(
+                        (
+                            external_id,
+                            issue_key,
+                            project_key,
+                            issue_meta.get("_seed_meta", {}).get("month_idx"),
+                            issue_meta["fields"]["issuetype"]["name"],
+                        )
+                    )
+                created_items.append(
+                    (project_key, issue_key, issue_meta, created_issue["needs_property"])
+                )
+
+        self.record_state(rows)
+
+        # Every shared-state update happens here, in creation order, so the
+        # concurrent fan-out below matches a serial run exactly.
+        tasks = []
+        for project_key, issue_key, issue_meta, needs_property in created_items:
+            meta = issue_meta.get("_seed_meta", {})
+            issue_type = issue_meta.get("fields", {}).get("issuetype", {}).get("name", "")
+            if issue_type.lower() == "incident":
+                target_status = "Resolved"
+            else:
+                target_status = "Done"
+
+            month_idx = meta.get("month_idx")
+            if isinstance(month_idx, int) and issue_type.lower() in ["story", "task", "bug"]:
+                self.issues_by_project_month[project_key][month_idx].append(issue_key)
+
+            link = None
+            link_external = issue_meta.get("_link_external_id")
+            link_type = issue_meta.get("_link_type")
+            if link_external and link_type:
+                target_key = self.issue_key_by_external_id.get(link_external)
+                if target_key:
+                    link = (link_type, target_key)
+
+            tasks.append(
+                {
+                    "issue_key": issue_key,
+                    "project_key": project_key,
+                    "issue_type": issue_type,
+                    "meta": meta,
+                    "needs_property": needs_property,
+                    "comment": issue_meta.get("_comment"),
+                    "target_status": target_status,
+                    "link": link,
+                }
+            )
+
+        self.run_post_create(tasks)
+
+    def run_post_create(self, tasks):
+        """
+        Run the per-issue follow-up calls for a created batch.
+
+        Each issue's calls stay in order (property fallback, comment, transitions,
+        link); with ``--workers`` above 1, different issues run concurrently on a
+        bounded thread pool. Link targets are always keys that already exist.
+        """
+        if self.args.workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                self.post_create_issue(task)
+            return
+        with ThreadPoolExecutor(max_workers=self.args.workers) as pool:
+            futures = [pool.submit(self.post_create_issue, task) for task in tasks]
+            for future in futures:
+                future.result()
+
+    def post_create_issue(self, task):
+        issue_key = task["issue_key"]
+        if task["needs_property"]:
+            self.client.set_issue_property(issue_key, "seed_meta", task["meta"])
+        if task["comment"]:
+            self.client.add_comment(issue_key, task["comment"])
+        self.apply_transitions(
+            issue_key, task["target_status"], task["project_key"], task["issue_type"]
+        )
+        if task["link"]:
+            link_type, target_key = task["link"]
+            self.client.create_issue_link(link_type, issue_key, target_key)
 
     def generate_followups(self):
         if not self.followup_specs or not self.args.enable_incidents:
@@ -871,7 +1840,7 @@ class JiraSeeder:
                 }
                 payload["_link_external_id"] = spec["incident_external_id"]
                 payload["_link_type"] = "Relates"
-                self.created_issues.append(payload)
+                self.enqueue_issue(payload)
                 self.existing_ids[project_key].add(label)
 
     def build_sprint_map(self):
@@ -884,6 +1853,13 @@ class JiraSeeder:
         return sprint_map
 
     def build_sprints(self, project_key, sprint_map):
+        """
+        Reconcile the project's board sprints with ``sprint_map``.
+
+        Existing sprints are diffed against the desired dates and only changed
+        fields are sent; missing sprints are created. The observed sprint states
+        are kept for ``finalize_sprints``.
+        """
         if not self.args.enable_sprints:
             return {}
         cached = self.sprints_by_project.get(project_key)
@@ -922,41 +1898,27 @@ class JiraSeeder:
                 existing_sprints[name] = s
 
         sprints = {}
+        states = {}
         for idx, (start_dt, end_dt) in enumerate(sprint_map):
             name = f"Sprint {idx + 1}"
             existing = existing_sprints.get(name)
             if existing:
-                existing_start = existing.get("startDate")
-                existing_end = existing.get("endDate")
-
-                def _parse_jira_datetime(value):
-                    if not value:
-                        return None
-                    # Jira typically returns ISO-8601 strings, sometimes with a trailing 'Z'
-                    text = value
-                    if text.endswith("Z"):
-                        text = text[:-1] + "+00:00"
-                    try:
-                        dt = datetime.datetime.fromisoformat(text)
-                    except ValueError:
-                        return None
-                    # Normalize to naive UTC to match sprint_map datetimes
-                    if dt.tzinfo is not None:
-                        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
-                    return dt
+                state = existing.get("state") or "future"
+                parsed_start = parse_jira_datetime(existing.get("startDate"))
+                parsed_end = parse_jira_datetime(existing.get("endDate"))
 
-                parsed_start = _parse_jira_datetime(existing_start)
-                parsed_end = _parse_jira_datetime(existing_end)
-
-                # If dates are missing or differ from the expected ones, update the sprint
-                if parsed_start != start_dt or parsed_end != end_dt:
+                # Closed sprints are immutable; otherwise fix missing or drifted dates
+                if state != "closed" and (parsed_start != start_dt or parsed_end != end_dt):
                     self.client.update_sprint(
                         existing.get("id"),
                         startDate=start_dt.isoformat() + "Z",
                         endDate=end_dt.isoformat() + "Z",
                     )
+                    self.count("sprint_sync", "date_updates")
 
+                self.count("sprint_sync", "reused")
                 sprints[name] = existing.get("id")
+                states[name] = state
                 continue
 
             sprint = self.client.create_sprint(
@@ -967,15 +1929,29 @@ class JiraSeeder:
             )
             if sprint and sprint.get("id"):
                 sprints[name] = sprint.get("id")
+                states[name] = sprint.get("state") or "future"
+                self.count("sprint_sync", "created")
         self.sprints_by_project[project_key] = sprints
+        self.sprint_states[project_key] = states
         return sprints
 
+    def for_each_project(self, func, project_keys):
+        """Run ``func(project_key)`` for every project, concurrently with ``--workers``."""
+        if self.args.workers > 1 and len(project_keys) > 1:
+            with ThreadPoolExecutor(max_workers=self.args.workers) as pool:
+                list(pool.map(func, project_keys))
+        else:
+            for project_key in project_keys:
+                func(project_key)
+
     def precreate_sprints(self):
         if not self.args.enable_sprints:
             return
         sprint_map = self.build_sprint_map()
-        for project in self.story["projects"]:
-            self.build_sprints(project["key"], sprint_map)
+        self.for_each_project(
+            lambda project_key: self.build_sprints(project_key, sprint_map),
+            [project["key"] for project in self.story["projects"]],
+        )
 
     def assign_sprints(self, project_key, sprint_map, issue_keys_by_month):
         if not self.args.enable_sprints:
@@ -1013,43 +1989,58 @@ class JiraSeeder:
                 self.assign_sprints(project_key, sprint_map, month_map)
 
     def finalize_sprints(self):
+        """
+        Move started sprints to their desired state, sending only the changes.
+
+        Sprints whose end date has passed should be closed and the sprint in
+        progress active; future sprints are left alone. Jira only closes active
+        sprints, so a future sprint that should be closed is started first.
+        """
         if not self.args.enable_sprints:
             return
+        self.for_each_project(self.sync_sprint_states, list(self.sprints_by_project))
 
+    def sync_sprint_states(self, project_key):
         sprint_map = self.build_sprint_map()
         now = utcnow_naive()
-
-        for project_key, sprints in self.sprints_by_project.items():
-            for idx, (start_dt, end_dt) in enumerate(sprint_map):
-                name = f"Sprint {idx + 1}"
-                sprint_id = sprints.get(name)
-                if not sprint_id:
-                    continue
-                    
-                # Only update sprints that have started; future sprints remain in their initial state
-                if start_dt <= now:
-                    state = "active"
-                    if end_dt <= now:
-                        state = "closed"
-                    self.client.update_sprint(sprint_id, state=state)
+        sprints = self.sprints_by_project.get(project_key, {})
+        states = self.sprint_states.get(project_key, {})
+        for idx, (start_dt, end_dt) in enumerate(sprint_map):
+            name = f"Sprint {idx + 1}"
+            sprint_id = sprints.get(name)
+            if not sprint_id or start_dt > now:
+                continue
+            desired = "closed" if end_dt <= now else "active"
+            current = states.get(name, "future")
+            if current == desired or current == "closed":
+                continue
+            if current == "future":
+                self.client.update_sprint(sprint_id, state="active")
+                self.count("sprint_sync", "state_updates")
+            if desired == "closed":
+                self.client.update_sprint(sprint_id, state="closed")
+                self.count("sprint_sync", "state_updates")
+            states[name] = desired
 
     def run(self):
         self.resolve_assignees()
 
         project_keys = [p["key"] for p in self.story["projects"]]
         incident_project = self.story.get("incident_project_key")
-        for key in project_keys:
-            self.prefetch_existing(key)
+        prefetch_keys = list(project_keys)
         if incident_project and incident_project not in project_keys:
-            self.prefetch_existing(incident_project)
+            prefetch_keys.append(incident_project)
+        self.prefetch_existing(prefetch_keys)
 
         self.precreate_sprints()
 
         for project in self.story["projects"]:
             self.ensure_epics_and_initiatives(project["key"], project["team_id"])
+        self.create_structure_issues()
 
         self.link_epics_cross_project(project_keys)
 
+        self.start_batch_writer()
         arcs = self.story["arcs"]
         for month_idx in range(self.month_count):
             arc = next(
@@ -1068,6 +2059,12 @@ class JiraSeeder:
         self.finalize_sprints()
 
         self.manifest["sprints"] = self.sprints_by_project
+        self.manifest["http"] = self.client.connection_stats()
+        self.manifest["rate_limit"] = self.client.limiter.summary()
+        self.transition_cache.save()
+        if self.state is not None:
+            self.state.close()
+        self.client.close()
 
         manifest_path = self.args.manifest
         with open(manifest_path, "w") as handle:
@@ -1095,6 +2092,31 @@ def parse_args():
     parser.add_argument("--seed", required=True)
     parser.add_argument("--assignees", default="")
     parser.add_argument("--batch-size", "--batch_size", dest="batch_size", type=int, default=50)
+    parser.add_argument(
+        "--http-pool-size",
+        "--http_pool_size",
+        dest="http_pool_size",
+        type=int,
+        default=10,
+        help="Maximum pooled keep-alive connections held open to Jira.",
+    )
+    parser.add_argument(
+        "--max-rps",
+        "--max_rps",
+        dest="max_rps",
+        type=float,
+        default=10.0,
+        help="Requests-per-second ceiling for the adaptive Jira rate limiter.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Threads for per-issue follow-up calls after each bulk create and for "
+            "per-project board/sprint setup and sprint state updates."
+        ),
+    )
     parser.add_argument("--start-date", "--start_date", dest="start_date", default=None)
     parser.add_argument("--end-date", "--end_date", dest="end_date", default=None)
     parser.add_argument(
@@ -1104,6 +2126,20 @@ def parse_args():
         type=int,
         default=None,
     )
+    parser.add_argument(
+        "--transition-cache",
+        "--transition_cache",
+        dest="transition_cache",
+        default=None,
+        help="JSON file for learned workflow transitions (default: next to the manifest).",
+    )
+    parser.add_argument(
+        "--state-db",
+        "--state_db",
+        dest="state_db",
+        default=None,
+        help="SQLite file recording created issues (default: next to the manifest).",
+    )
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--disable-sprints", action="store_true")
     parser.add_argument("--disable-transitions", action="store_true")
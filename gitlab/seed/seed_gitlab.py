@@ -4,13 +4,25 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
 import datetime as dt
+import functools
 import hashlib
+import io
 import json
+import gzip
+import itertools
 import os
 import random
+import shutil
+import subprocess  # nosec B404 - drives the local git binary for export bundles
+import tarfile
+import tempfile
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import quote
 
@@ -25,8 +37,34 @@ THEMES = {
     "Risk / Security",
 }
 
+IMPORT_POLL_SECONDS = 5.0
+GRAPHQL_FULL_PATHS_LIMIT = 50
+SEED_BRANCH_PREFIX = "seed/chaos-246/"
+PREFETCH_WORKERS = 8
+NOTE_ATTEMPTS = 3
+
+EXPORT_VERSION = "0.2.4"
+EXPORT_AUTHOR = "Dev Health Seeder <seeder@dev-health.invalid>"
+EXPORT_LABEL_COLOR = "#6699cc"
+
+PIPELINE_JOBS = {
+    "build": "build:compile",
+    "test": "test:unit",
+    "security": "security:scan",
+    "deploy": "deploy:review",
+}
+
 CI_CONFIG = """stages:\n  - build\n  - test\n  - security\n  - deploy\n\n.seeded-job:\n  image: alpine:3.20\n  script:\n    - echo \"seeded $CI_JOB_STAGE job for Developer Health fixtures\"\n    - if [ \"$FAIL_STAGE\" = \"$CI_JOB_STAGE\" ]; then exit 1; fi\n\nbuild:compile:\n  extends: .seeded-job\n  stage: build\n\ntest:unit:\n  extends: .seeded-job\n  stage: test\n\nsecurity:scan:\n  extends: .seeded-job\n  stage: security\n\ndeploy:review:\n  extends: .seeded-job\n  stage: deploy\n"""
 
+README_CONTENT = (
+    "# Seeded Dev Health Project\n\nGenerated by gitlab/seed/seed_gitlab.py.\n"
+)
+
+SEED_FILES = {
+    ".gitlab-ci.yml": (CI_CONFIG, "seed: add deterministic fixture pipeline config"),
+    "README.md": (README_CONTENT, "seed: add fixture project readme"),
+}
+
 
 def stable_hash(value: str, length: int = 12) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()[:length]
@@ -67,6 +105,78 @@ def pick_weighted(rng: random.Random, weights: dict[str, float]) -> str:
     return rng.choices(keys, weights=vals, k=1)[0]
 
 
+def git_blob_id(content: str) -> str:
+    """The SHA-1 git assigns to a blob holding ``content``."""
+    raw = content.encode("utf-8")
+    header = f"blob {len(raw)}\0".encode("utf-8")
+    return hashlib.sha1(header + raw, usedforsecurity=False).hexdigest()
+
+
+def export_time(value: dt.datetime) -> str:
+    return value.isoformat(timespec="milliseconds") + "Z"
+
+
+def write_git_bundle(
+    bundle_path: Path, default_branch: str, commits: list[dict], tags: dict[str, str]
+) -> dict[str, str]:
+    """Write commits and tags into a git bundle; return each branch's head SHA.
+
+    ``commits`` are applied in order with ``git fast-import`` so author and
+    committer dates can be historic. Each is a dict with ``ref`` (branch),
+    ``parent`` (branch to fork from, or None), ``message``, ``when`` and
+    ``files`` (path -> content). ``tags`` maps tag names to branches.
+    """
+    git = shutil.which("git")
+    if not git:
+        raise RuntimeError("git is required to build GitLab export bundles")
+
+    stream = bytearray()
+    marks: dict[str, int] = {}
+    for mark, commit in enumerate(commits, start=1):
+        stamp = int(commit["when"].replace(tzinfo=dt.UTC).timestamp())
+        ident = f"{EXPORT_AUTHOR} {stamp} +0000"
+        message = commit["message"].encode("utf-8")
+        stream += (
+            f"commit refs/heads/{commit['ref']}\nmark :{mark}\n"
+            f"author {ident}\ncommitter {ident}\ndata {len(message)}\n"
+        ).encode("utf-8")
+        stream += message + b"\n"
+        if commit["parent"]:
+            stream += f"from :{marks[commit['parent']]}\n".encode("utf-8")
+        for path, content in commit["files"].items():
+            raw = content.encode("utf-8")
+            stream += f"M 100644 inline {path}\ndata {len(raw)}\n".encode("utf-8")
+            stream += raw + b"\n"
+        stream += b"\n"
+        marks[commit["ref"]] = mark
+    for tag, ref in tags.items():
+        stream += f"reset refs/tags/{tag}\nfrom :{marks[ref]}\n\n".encode("utf-8")
+
+    with tempfile.TemporaryDirectory() as repo:
+
+        def git_run(*args: str, stdin: bytes | None = None) -> None:
+            subprocess.run(  # nosec B603 - fixed git arguments, no shell
+                [git, "-C", repo, *args], input=stdin, capture_output=True, check=True
+            )
+
+        git_run("init", "--bare", "--quiet")
+        git_run("symbolic-ref", "HEAD", f"refs/heads/{default_branch}")
+        marks_path = Path(repo) / "seed-marks"
+        git_run(
+            "fast-import",
+            "--quiet",
+            f"--export-marks={marks_path}",
+            stdin=bytes(stream),
+        )
+        bundle = str(bundle_path.resolve())
+        git_run("-c", "pack.threads=1", "bundle", "create", bundle, "--all")
+        sha_by_mark = {}
+        for line in marks_path.read_text(encoding="utf-8").splitlines():
+            mark, sha = line.split()
+            sha_by_mark[int(mark.lstrip(":"))] = sha
+    return {ref: sha_by_mark[mark] for ref, mark in marks.items()}
+
+
 def as_plain_dict(value):
     if isinstance(value, defaultdict):
         return {key: as_plain_dict(item) for key, item in value.items()}
@@ -77,6 +187,10 @@ def as_plain_dict(value):
     return value
 
 
+class UnansweredRequest(RuntimeError):
+    """A non-replayable request failed in a way GitLab may already have applied."""
+
+
 class GitLabClient:
     """Small GitLab REST + GraphQL API wrapper.
 
@@ -104,7 +218,15 @@ class GitLabClient:
         endpoint: str,
         data: dict | None = None,
         params: dict | None = None,
+        files: dict | None = None,
+        replay: bool = True,
     ):
+        """Send one API call; return the parsed body, or None when it fails.
+
+        With ``replay=False`` only 429 responses, which GitLab did not apply,
+        are retried. A network or server error raises ``UnansweredRequest``
+        instead, because the request may have been applied.
+        """
         if self.dry_run:
             self.log(f"DRY {method} {endpoint}")
             return None
@@ -113,9 +235,10 @@ class GitLabClient:
 
         headers = {
             "Accept": "application/json",
-            "Content-Type": "application/json",
             "PRIVATE-TOKEN": self.token or "",
         }
+        if files is None:
+            headers["Content-Type"] = "application/json"
         url = f"{self.base_url}{endpoint}"
         for attempt in range(3):
             try:
@@ -124,11 +247,14 @@ class GitLabClient:
                     url,
                     json=data,
                     params=params,
+                    files=files,
                     headers=headers,
                     timeout=40,
                 )
             except requests.RequestException as exc:
                 self.log(f"Exception on {method} {endpoint}: {exc}")
+                if not replay:
+                    raise UnansweredRequest(f"{method} {endpoint}: {exc}") from exc
                 time.sleep(2**attempt)
                 continue
 
@@ -140,12 +266,20 @@ class GitLabClient:
                 f"Error {response.status_code} on {method} {endpoint} "
                 f"(attempt {attempt + 1}/3): {response.text[:300]}"
             )
-            if response.status_code not in {409, 429, 500, 502, 503, 504}:
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "")
+                time.sleep(int(retry_after) if retry_after.isdigit() else 2**attempt)
+                continue
+            if response.status_code not in {409, 500, 502, 503, 504}:
                 break
+            if not replay and response.status_code >= 500:
+                raise UnansweredRequest(
+                    f"{method} {endpoint}: HTTP {response.status_code}"
+                )
             time.sleep(2**attempt)
         return None
 
-    def graphql(self, query: str, variables: dict | None = None):
+    def graphql(self, query: str, variables: dict | None = None, replay: bool = True):
         if self.dry_run:
             self.log("DRY POST /graphql")
             return None
@@ -153,6 +287,25 @@ class GitLabClient:
             "POST",
             "/graphql",
             data={"query": query, "variables": variables or {}},
+            replay=replay,
+        )
+
+    def graphql_upload(
+        self, query: str, variables: dict, file_variable: str, filename: str, body: str
+    ):
+        """Run a GraphQL mutation with one file, per the multipart request spec."""
+        if self.dry_run:
+            self.log(f"DRY POST /graphql (upload {filename})")
+            return None
+        operations = {"query": query, "variables": {**variables, file_variable: None}}
+        return self.request(
+            "POST",
+            "/graphql",
+            files={
+                "operations": (None, json.dumps(operations)),
+                "map": (None, json.dumps({"0": [f"variables.{file_variable}"]})),
+                "0": (filename, body.encode("utf-8"), "text/csv"),
+            },
         )
 
 
@@ -168,10 +321,21 @@ class GitLabSeeder:
         seed_hash = int(hashlib.sha256(seed_input.encode("utf-8")).hexdigest(), 16)
         self.rng = random.Random(seed_hash)  # nosec B311 - deterministic fixtures
         self.client = GitLabClient(args.base_url, args.token, args.dry_run)
+        # Export-only runs plan like a real run but never call the API.
+        self.offline = args.dry_run or (
+            bool(args.export_dir) and not args.import_exports
+        )
 
         self.group: dict = {}
         self.projects: dict[str, dict] = {}
+        # Full paths whose GraphQL lookup failed, as opposed to found absent.
+        self.failed_lookups: set[str] = set()
         self.existing_labels: dict[str, set[str]] = defaultdict(set)
+        self.seeded_issues: dict[str, dict[str, dict]] = defaultdict(dict)
+        self.note_buffer: list[dict] = []
+        self.note_lock = threading.Lock()
+        self.pending_imports: dict[str, list[dict]] = defaultdict(list)
+        self.unresolved_imports: set[str] = set()
         self.reviewers: list[int] = []
         self.team_primary_project = {
             team["id"]: team["primary_project"] for team in self.story.get("teams", [])
@@ -206,8 +370,23 @@ class GitLabSeeder:
             },
             "releases": {"created": 0, "by_project": defaultdict(int)},
             "comments": {"issues": 0, "merge_requests": 0},
-            "graphql": {"project_lookups": 0},
+            "graphql": {"project_lookups": 0, "note_batches": 0, "note_failures": 0},
         }
+        if args.export_dir:
+            self.manifest["exports"] = {
+                "projects": 0,
+                "imported": 0,
+                "failed": 0,
+                "skipped_existing": 0,
+            }
+        if args.issue_import == "csv":
+            self.manifest["issue_import"] = {
+                "uploads": 0,
+                "rows": 0,
+                "reconciled": 0,
+                "unresolved": 0,
+            }
+        self.manifest_lock = threading.Lock()
 
     def validate_story(self) -> None:
         configured = set(self.story.get("canonical_themes", []))
@@ -247,7 +426,7 @@ class GitLabSeeder:
         return quote(project["path_with_namespace"], safe="")
 
     def ensure_group(self) -> dict:
-        if self.args.dry_run:
+        if self.offline:
             self.group = {
                 "id": stable_int(self.args.group_path),
                 "full_path": self.args.group_path,
@@ -272,130 +451,289 @@ class GitLabSeeder:
         self.group = group
         return group
 
-    def graphql_project(self, full_path: str) -> dict | None:
+    def graphql_projects(self, full_paths: list[str]) -> dict[str, dict]:
+        """Look up every story project in as few GraphQL round trips as possible.
+
+        Besides the default branch, each node carries whether the ``seeded``
+        label exists (no label means no seeded issues to prefetch) and the
+        project's release tags, so later phases can skip per-item GETs.
+        Paths in a chunk whose query failed are recorded in ``failed_lookups``.
+        """
         query = """
-        query ProjectSeedLookup($fullPath: ID!) {
-          project(fullPath: $fullPath) {
-            id
-            fullPath
-            repository { rootRef }
+        query ProjectSeedLookup($fullPaths: [String!], $first: Int) {
+          projects(fullPaths: $fullPaths, first: $first) {
+            nodes {
+              id
+              fullPath
+              repository { rootRef }
+              labels(searchTerm: "seeded", includeAncestorGroups: true, first: 20) {
+                nodes { title }
+              }
+              releases(first: 100) {
+                pageInfo { hasNextPage }
+                nodes { tagName }
+              }
+            }
           }
         }
         """
-        result = self.client.graphql(query, {"fullPath": full_path})
-        self.manifest["graphql"]["project_lookups"] += 1
-        if not result:
-            return None
-        return result.get("data", {}).get("project")
+        found: dict[str, dict] = {}
+        for start in range(0, len(full_paths), GRAPHQL_FULL_PATHS_LIMIT):
+            chunk = full_paths[start : start + GRAPHQL_FULL_PATHS_LIMIT]
+            result = self.client.graphql(
+                query, {"fullPaths": chunk, "first": len(chunk)}
+            )
+            self.manifest["graphql"]["project_lookups"] += 1
+            if not result:
+                self.log(f"Project lookup failed for {len(chunk)} projects")
+                self.failed_lookups.update(chunk)
+                continue
+            projects = (result.get("data") or {}).get("projects") or {}
+            for node in projects.get("nodes") or []:
+                found[node["fullPath"]] = node
+        return found
 
-    def ensure_project(self, project_spec: dict) -> dict:
+    def ensure_project(self, project_spec: dict, lookup: dict | None) -> dict:
         full_path = f"{self.args.group_path}/{project_spec['path']}"
         if self.args.dry_run:
+            return self.stub_project(project_spec)
+
+        if lookup:
             project = {
-                "id": stable_int(full_path),
+                "id": int(lookup["id"].rsplit("/", 1)[-1]),
                 "path": project_spec["path"],
                 "name": project_spec["name"],
-                "path_with_namespace": full_path,
-                "default_branch": "main",
-                "graphql": {"id": f"gid://gitlab/Project/{stable_int(full_path)}"},
+                "path_with_namespace": lookup["fullPath"],
+                "default_branch": (lookup.get("repository") or {}).get("rootRef"),
             }
-            self.projects[project_spec["path"]] = project
-            return project
+        else:
+            project = self.rest_project(full_path)
+            if not project:
+                project = self.client.request(
+                    "POST",
+                    "/projects",
+                    data={
+                        "name": project_spec["name"],
+                        "path": project_spec["path"],
+                        "namespace_id": self.group["id"],
+                        "initialize_with_readme": True,
+                        "visibility": "private",
+                    },
+                )
+                if not project:
+                    raise RuntimeError(f"Unable to create or fetch project {full_path}")
+                project["created"] = True
+        # Only a fetched lookup node may shortcut the prefetches; an empty dict
+        # means they have to ask GitLab (or, for a new project, skip).
+        project["graphql"] = lookup or {}
+        self.projects[project_spec["path"]] = project
+        return project
 
-        encoded = quote(full_path, safe="")
-        project = self.client.request("GET", f"/projects/{encoded}")
-        if not project:
-            project = self.client.request(
-                "POST",
-                "/projects",
-                data={
-                    "name": project_spec["name"],
-                    "path": project_spec["path"],
-                    "namespace_id": self.group["id"],
-                    "initialize_with_readme": True,
-                    "visibility": "private",
-                },
-            )
-        if not project:
-            raise RuntimeError(f"Unable to create or fetch project {full_path}")
-        project["graphql"] = self.graphql_project(full_path) or {}
+    def rest_project(self, full_path: str) -> dict | None:
+        return self.client.request("GET", f"/projects/{quote(full_path, safe='')}")
+
+    def stub_project(self, project_spec: dict) -> dict:
+        """Stand-in project for runs that never talk to GitLab."""
+        full_path = f"{self.args.group_path}/{project_spec['path']}"
+        project = {
+            "id": stable_int(full_path),
+            "path": project_spec["path"],
+            "name": project_spec["name"],
+            "path_with_namespace": full_path,
+            "default_branch": "main",
+            "graphql": {"id": f"gid://gitlab/Project/{stable_int(full_path)}"},
+        }
         self.projects[project_spec["path"]] = project
         return project
 
+    def has_seeded_label(self, project: dict) -> bool:
+        """False only when the project is new or its lookup shows no label."""
+        if project.get("created"):
+            return False
+        if not project["graphql"]:
+            return True
+        labels = (project["graphql"].get("labels") or {}).get("nodes") or []
+        return any(label["title"] == "seeded" for label in labels)
+
+    def prefetch_releases(self, project: dict) -> None:
+        """Collect the project's release tags, from the lookup when it has them all."""
+        project["release_tags"] = set()
+        if self.args.dry_run or project.get("created"):
+            return
+        releases = project["graphql"].get("releases")
+        if releases and not (releases.get("pageInfo") or {}).get("hasNextPage"):
+            project["release_tags"] = {
+                node["tagName"] for node in releases.get("nodes") or []
+            }
+            return
+        project_id = self.encoded_project(project)
+        page = 1
+        while True:
+            batch = self.client.request(
+                "GET",
+                f"/projects/{project_id}/releases",
+                params={"per_page": 100, "page": page},
+            )
+            if not batch:
+                break
+            project["release_tags"].update(item["tag_name"] for item in batch)
+            if len(batch) < 100:
+                break
+            page += 1
+
     def ensure_repository_seed_files(self, project: dict) -> None:
+        """Write all seed files in one commit, or none when they are current.
+
+        One root tree listing tells which files exist; their blob IDs are
+        compared with the git hash of the wanted content, so unchanged files
+        need no write at all.
+        """
         if self.args.dry_run:
             return
         project_id = self.encoded_project(project)
-        self.ensure_file(
-            project_id,
-            ".gitlab-ci.yml",
-            CI_CONFIG,
-            "seed: add deterministic fixture pipeline config",
-        )
-        self.ensure_file(
-            project_id,
-            "README.md",
-            "# Seeded Dev Health Project\n\nGenerated by gitlab/seed/seed_gitlab.py.\n",
-            "seed: add fixture project readme",
-        )
-
-    def ensure_file(
-        self, project_id: str, file_path: str, content: str, commit_message: str
-    ) -> None:
-        encoded_file = quote(file_path, safe="")
-        exists = self.client.request(
+        branch = project.get("default_branch") or "main"
+        tree = self.client.request(
             "GET",
-            f"/projects/{project_id}/repository/files/{encoded_file}",
-            params={"ref": "main"},
+            f"/projects/{project_id}/repository/tree",
+            params={"ref": branch, "per_page": 100},
         )
-        method = "PUT" if exists else "POST"
+        blobs = {
+            entry["path"]: entry["id"]
+            for entry in tree or []
+            if entry.get("type") == "blob"
+        }
+        actions = []
+        messages = []
+        for file_path, (content, commit_message) in SEED_FILES.items():
+            if blobs.get(file_path) == git_blob_id(content):
+                continue
+            actions.append(
+                {
+                    "action": "update" if file_path in blobs else "create",
+                    "file_path": file_path,
+                    "content": content,
+                }
+            )
+            messages.append(commit_message)
+        if not actions:
+            return
+        message = messages[0]
+        if len(messages) > 1:
+            message = "seed: add fixture project files"
         self.client.request(
-            method,
-            f"/projects/{project_id}/repository/files/{encoded_file}",
-            data={
-                "branch": "main",
-                "content": content,
-                "commit_message": commit_message,
-            },
+            "POST",
+            f"/projects/{project_id}/repository/commits",
+            data={"branch": branch, "commit_message": message, "actions": actions},
         )
 
     def resolve_reviewers(self) -> None:
         usernames = [
             item.strip() for item in self.args.reviewers.split(",") if item.strip()
         ]
-        if not usernames or self.args.dry_run:
+        if not usernames or self.offline:
             self.reviewers = [stable_int(name, 100_000) for name in usernames]
             return
-        for username in usernames:
-            users = self.client.request("GET", "/users", params={"username": username})
-            if users:
-                self.reviewers.append(users[0]["id"])
-        self.log(f"Resolved {len(self.reviewers)} GitLab reviewers")
+        cache_path = Path(
+            self.args.reviewer_cache
+            or Path(self.args.manifest).resolve().parent / "reviewer_cache.json"
+        )
+        cache = self.load_reviewer_cache(cache_path)
+        known = cache.setdefault(self.client.web_url, {})
+        missing = [name for name in usernames if name not in known]
+        if missing:
+            known.update(self.graphql_users(missing))
+            self.save_reviewer_cache(cache_path, cache)
+        self.reviewers = [known[name] for name in usernames if name in known]
+        self.log(
+            f"Resolved {len(self.reviewers)} GitLab reviewers "
+            f"({len(usernames) - len(missing)} cached)"
+        )
 
-    def prefetch_existing(self, project: dict) -> None:
-        if self.args.dry_run:
-            return
-        project_id = self.encoded_project(project)
-        page = 1
-        labels: set[str] = set()
+    def graphql_users(self, usernames: list[str]) -> dict[str, int]:
+        query = """
+        query SeedReviewers($usernames: [String!], $first: Int) {
+          users(usernames: $usernames, first: $first) {
+            nodes { id username }
+          }
+        }
+        """
+        found: dict[str, int] = {}
+        for start in range(0, len(usernames), 100):
+            chunk = usernames[start : start + 100]
+            variables = {"usernames": chunk, "first": len(chunk)}
+            result = self.client.graphql(query, variables)
+            users = ((result or {}).get("data") or {}).get("users") or {}
+            for node in users.get("nodes") or []:
+                found[node["username"]] = int(node["id"].rsplit("/", 1)[-1])
+        return found
+
+    def load_reviewer_cache(self, path: Path) -> dict:
+        """Username -> user ID maps keyed by GitLab instance URL."""
+        try:
+            with path.open(encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def save_reviewer_cache(self, path: Path, cache: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(cache, handle, indent=2, sort_keys=True)
+
+    def fetch_seeded_issues(self, project: dict) -> dict[str, dict]:
+        """Map each seeded issue's ``extid::`` label to its iid and global ID.
+
+        Uses a cursor-paginated GraphQL query that returns only IDs and label
+        titles, instead of offset pages of full REST issue bodies.
+        """
+        query = """
+        query SeededIssues($fullPath: ID!, $after: String) {
+          project(fullPath: $fullPath) {
+            issues(labelName: ["seeded"], first: 100, after: $after) {
+              pageInfo { hasNextPage endCursor }
+              nodes {
+                id
+                iid
+                labels(first: 20) { nodes { title } }
+              }
+            }
+          }
+        }
+        """
+        found: dict[str, dict] = {}
+        after = None
         while True:
-            issues = self.client.request(
-                "GET",
-                f"/projects/{project_id}/issues",
-                params={"labels": "seeded", "per_page": 100, "page": page},
+            result = self.client.graphql(
+                query, {"fullPath": project["path_with_namespace"], "after": after}
             )
+            data = (result or {}).get("data") or {}
+            issues = (data.get("project") or {}).get("issues")
             if not issues:
+                if result and result.get("errors"):
+                    self.log(f"Seeded issue lookup failed: {result['errors']}")
                 break
-            for issue in issues:
-                for label in issue.get("labels", []) or []:
-                    if label.startswith("extid::"):
-                        labels.add(label)
-            if len(issues) < 100:
+            for issue in issues.get("nodes") or []:
+                for label in (issue.get("labels") or {}).get("nodes") or []:
+                    if label["title"].startswith("extid::"):
+                        found[label["title"]] = {
+                            "iid": int(issue["iid"]),
+                            "id": issue["id"],
+                        }
+            page_info = issues.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
                 break
-            page += 1
-        self.existing_labels[project["path"]] = labels
-        if labels:
-            self.log(f"Found {len(labels)} existing seeded issues in {project['path']}")
+            after = page_info.get("endCursor")
+        return found
+
+    def prefetch_existing(self, project: dict) -> None:
+        if self.args.dry_run or not self.has_seeded_label(project):
+            return
+        found = self.fetch_seeded_issues(project)
+        self.seeded_issues[project["path"]] = found
+        self.existing_labels[project["path"]] = set(found)
+        if found:
+            self.log(f"Found {len(found)} existing seeded issues in {project['path']}")
 
     def record_issue(
         self,
@@ -434,7 +772,14 @@ class GitLabSeeder:
         project_path = project["path"]
         ext_label = f"extid::{spec['external_id']}"
         if ext_label in self.existing_labels[project_path]:
-            return {"iid": stable_int(spec["external_id"], 50_000), "skipped": True}
+            known = self.seeded_issues[project_path].get(ext_label) or {}
+            return {
+                "iid": known.get("iid") or stable_int(spec["external_id"], 50_000),
+                "gid": known.get("id"),
+                "skipped": True,
+            }
+        if ext_label in self.unresolved_imports:
+            return {"iid": stable_int(spec["external_id"], 50_000), "error": True}
         if self.args.dry_run:
             self.existing_labels[project_path].add(ext_label)
             return {"iid": stable_int(spec["external_id"], 50_000), "dry_run": True}
@@ -449,62 +794,263 @@ class GitLabSeeder:
             "POST", f"/projects/{self.encoded_project(project)}/issues", data=payload
         )
         if issue:
+            issue["gid"] = f"gid://gitlab/Issue/{issue['id']}"
             self.existing_labels[project_path].add(ext_label)
-            if self.args.enable_comments and self.rng.random() < spec["comment_rate"]:
-                self.add_issue_note(project, issue["iid"], spec["arc_name"])
+            self.seeded_issues[project_path][ext_label] = {
+                "iid": issue["iid"],
+                "id": issue["gid"],
+            }
         return issue or {"iid": stable_int(spec["external_id"], 50_000), "error": True}
 
-    def add_issue_note(self, project: dict, issue_iid: int, arc_name: str) -> None:
+    def issue_csv(self, specs: list[dict]) -> str:
+        """Render specs in GitLab's CSV import format.
+
+        CSV imports cannot set labels directly, so they are applied with a
+        ``/label`` quick action appended to each description.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["title", "type", "description"])
+        for spec in specs:
+            labels = " ".join(f'~"{label}"' for label in spec["labels"])
+            description = f"{spec['description']}\n\n/label {labels}"
+            writer.writerow([spec["title"], "Issue", description])
+        return buffer.getvalue()
+
+    def import_issues_csv(self) -> None:
+        """Create all planned issues with one CSV upload per project.
+
+        Imports run asynchronously in GitLab, so the seeded issue list is
+        polled until every uploaded ``extid::`` label has an iid. Rows still
+        missing at ``--import-timeout`` are reported and left for the next run
+        rather than re-created one by one, which could duplicate them.
+        """
+        query = """
+        mutation SeedIssueImport($projectPath: ID!, $file: Upload!) {
+          workItemsCsvImport(input: {projectPath: $projectPath, file: $file}) {
+            message
+            errors
+          }
+        }
+        """
+        waiting: dict[str, set[str]] = {}
+        for project_path, specs in self.pending_imports.items():
+            project = self.projects[project_path]
+            result = self.client.graphql_upload(
+                query,
+                {"projectPath": project["path_with_namespace"]},
+                "file",
+                f"{project_path}-seed-issues.csv",
+                self.issue_csv(specs),
+            )
+            self.manifest["issue_import"]["uploads"] += 1
+            self.manifest["issue_import"]["rows"] += len(specs)
+            payload = ((result or {}).get("data") or {}).get("workItemsCsvImport")
+            if payload and payload.get("errors"):
+                self.log(f"CSV import errors for {project_path}: {payload['errors']}")
+            waiting[project_path] = {
+                f"extid::{spec['external_id']}" for spec in specs
+            }
+        self.pending_imports.clear()
+        if self.args.dry_run:
+            return
+
+        deadline = time.monotonic() + self.args.import_timeout
+        while waiting:
+            for project_path in list(waiting):
+                found = self.fetch_seeded_issues(self.projects[project_path])
+                arrived = waiting[project_path] & set(found)
+                for label in arrived:
+                    self.seeded_issues[project_path][label] = found[label]
+                self.existing_labels[project_path] |= arrived
+                self.manifest["issue_import"]["reconciled"] += len(arrived)
+                waiting[project_path] -= arrived
+                if not waiting[project_path]:
+                    del waiting[project_path]
+            if not waiting or time.monotonic() >= deadline:
+                break
+            time.sleep(IMPORT_POLL_SECONDS)
+
+        for project_path, labels in waiting.items():
+            self.log(
+                f"{len(labels)} imported issues in {project_path} not visible after "
+                f"{self.args.import_timeout}s; re-run to pick them up"
+            )
+            self.unresolved_imports |= labels
+            self.manifest["issue_import"]["unresolved"] += len(labels)
+
+    def add_issue_note(self, project: dict, issue: dict, arc_name: str) -> None:
         body = f"Seeder note: work progressed during the {arc_name} arc."
         if not self.args.dry_run:
-            self.client.request(
-                "POST",
-                f"/projects/{self.encoded_project(project)}/issues/{issue_iid}/notes",
-                data={"body": body},
+            project_id = self.encoded_project(project)
+            self.queue_note(
+                issue.get("gid"),
+                f"/projects/{project_id}/issues/{issue['iid']}/notes",
+                body,
             )
-        self.manifest["comments"]["issues"] += 1
+        self.count("comments", "issues")
 
-    def create_branch_and_commit(self, project: dict, branch: str, spec: dict) -> None:
-        if self.args.dry_run:
+    def queue_note(self, noteable_id: str | None, endpoint: str, body: str) -> None:
+        """Buffer a note for the next GraphQL batch, or POST it when unbatched."""
+        if not noteable_id or self.args.note_batch_size <= 1:
+            self.client.request("POST", endpoint, data={"body": body})
             return
-        project_id = self.encoded_project(project)
-        branch_data = self.client.request(
-            "GET",
-            f"/projects/{project_id}/repository/branches/{quote(branch, safe='')}",
+        with self.note_lock:
+            self.note_buffer.append(
+                {"noteable_id": noteable_id, "endpoint": endpoint, "body": body}
+            )
+            if len(self.note_buffer) < self.args.note_batch_size:
+                return
+            batch, self.note_buffer = self.note_buffer, []
+        self.send_note_batch(batch)
+
+    def flush_notes(self) -> None:
+        with self.note_lock:
+            batch, self.note_buffer = self.note_buffer, []
+        if batch:
+            self.send_note_batch(batch)
+
+    def send_note_batch(self, notes: list[dict]) -> None:
+        """Create notes as aliased mutations, retrying only the aliases that fail.
+
+        Notes are not idempotent, so only aliases the response shows without a
+        created note are re-sent. Without any response the server may still
+        have committed some aliases, so the batch is given up, not replayed.
+        """
+        pending = notes
+        for attempt in range(NOTE_ATTEMPTS):
+            if attempt:
+                time.sleep(2**attempt)
+            failed = self.create_notes(pending)
+            if failed is None:
+                break
+            pending = failed
+            if not pending:
+                return
+        for note in pending:
+            self.log(f"Giving up on note for {note['endpoint']}")
+        self.count("graphql", "note_failures", len(pending))
+
+    def create_notes(self, notes: list[dict]) -> list[dict] | None:
+        """Send one createNote alias per note; return the notes not created.
+
+        Returns None when the request got no answer; a request GitLab refused
+        (for example still throttled after its 429 retries) fails every note.
+        """
+        declarations = []
+        fields = []
+        variables = {}
+        for idx, note in enumerate(notes):
+            declarations.append(f"$id{idx}: NoteableID!, $body{idx}: String!")
+            fields.append(
+                f"n{idx}: createNote(input: {{noteableId: $id{idx}, body: $body{idx}}})"
+                " { note { id } errors }"
+            )
+            variables[f"id{idx}"] = note["noteable_id"]
+            variables[f"body{idx}"] = note["body"]
+        query = (
+            f"mutation SeedNotes({', '.join(declarations)}) {{\n  "
+            + "\n  ".join(fields)
+            + "\n}"
         )
-        if not branch_data:
-            self.client.request(
-                "POST",
+        # The client must not replay the batch: that would repeat every alias.
+        try:
+            result = self.client.graphql(query, variables, replay=False)
+        except UnansweredRequest as exc:
+            self.log(f"Note batch got no answer: {exc}")
+            return None
+        finally:
+            self.count("graphql", "note_batches")
+        data = (result or {}).get("data") or {}
+        return [
+            note
+            for idx, note in enumerate(notes)
+            if not ((data.get(f"n{idx}") or {}).get("note") or {}).get("id")
+        ]
+
+    def prefetch_branches(self, project: dict) -> None:
+        """Record the head SHA of every seeded MR branch in ``project``."""
+        branches: dict[str, str] = {}
+        if self.args.dry_run or project.get("created"):
+            project["seed_branches"] = branches
+            return
+        project_id = self.encoded_project(project)
+        page = 1
+        while True:
+            batch = self.client.request(
+                "GET",
                 f"/projects/{project_id}/repository/branches",
-                data={"branch": branch, "ref": project.get("default_branch") or "main"},
+                params={
+                    "search": f"^{SEED_BRANCH_PREFIX}",
+                    "per_page": 100,
+                    "page": page,
+                },
             )
-        content = (
+            if not batch:
+                break
+            for item in batch:
+                branches[item["name"]] = (item.get("commit") or {}).get("id")
+            if len(batch) < 100:
+                break
+            page += 1
+        project["seed_branches"] = branches
+
+    def fixture_content(self, spec: dict) -> str:
+        return (
             f"# {spec['title']}\n\n"
             f"- external_id: {spec['external_id']}\n"
             f"- theme: {spec['theme']}\n"
             f"- arc: {spec['arc_name']}\n"
         )
-        self.client.request(
-            "POST",
-            f"/projects/{project_id}/repository/commits",
-            data={
-                "branch": branch,
-                "commit_message": f"seed: fixture change for {spec['external_id']}",
-                "actions": [
-                    {
-                        "action": "create",
-                        "file_path": f"fixtures/{spec['external_id']}.md",
-                        "content": content,
-                    }
-                ],
-            },
+
+    def create_branch_and_commit(
+        self, project: dict, branch: str, spec: dict
+    ) -> str | None:
+        """Commit the fixture file on ``branch``; return the commit SHA if known.
+
+        New branches are created by the commit itself via ``start_branch``.
+        Branches already in the prefetched list were created together with
+        their fixture file, so they need no request at all.
+        """
+        if self.args.dry_run:
+            return None
+        if branch in project["seed_branches"]:
+            return project["seed_branches"][branch]
+        project_id = self.encoded_project(project)
+        commit_message = f"seed: fixture change for {spec['external_id']}"
+        if self.args.pipeline_mode == "statuses":
+            # Statuses stand in for CI, so keep the push from starting a real pipeline.
+            commit_message += " [skip ci]"
+        content = self.fixture_content(spec)
+        payload = {
+            "branch": branch,
+            "start_branch": project.get("default_branch") or "main",
+            "commit_message": commit_message,
+            "actions": [
+                {
+                    "action": "create",
+                    "file_path": f"fixtures/{spec['external_id']}.md",
+                    "content": content,
+                }
+            ],
+        }
+        endpoint = f"/projects/{project_id}/repository/commits"
+        commit = self.client.request("POST", endpoint, data=payload)
+        if not commit:
+            # The branch exists after all; commit onto it directly.
+            payload.pop("start_branch")
+            commit = self.client.request("POST", endpoint, data=payload)
+        if commit:
+            project["seed_branches"][branch] = commit.get("id")
+            return commit.get("id")
+        # The fixture file is already there; fall back to the branch head.
+        branch_data = self.client.request(
+            "GET",
+            f"/projects/{project_id}/repository/branches/{quote(branch, safe='')}",
         )
+        return ((branch_data or {}).get("commit") or {}).get("id")
 
-    def create_merge_request(
-        self, project: dict, issue: dict, spec: dict, arc: dict
-    ) -> None:
-        branch = f"seed/chaos-246/{spec['external_id']}"
-        self.create_branch_and_commit(project, branch, spec)
+    def plan_merge_request(self, spec: dict, arc: dict) -> dict:
         reviewers = self.pick_reviewers(arc)
         state = (
             "merged"
@@ -513,6 +1059,24 @@ class GitLabSeeder:
         )
         self.manifest["merge_requests"]["created"] += 1
         self.manifest["merge_requests"][state] += 1
+        comment = (
+            self.args.enable_comments
+            and self.rng.random() < arc["review_profile"]["comment_rate"]
+        )
+        pipeline = (
+            self.plan_pipeline(spec, arc) if self.args.enable_pipelines else None
+        )
+        return {
+            "branch": f"{SEED_BRANCH_PREFIX}{spec['external_id']}",
+            "reviewers": reviewers,
+            "state": state,
+            "comment": comment,
+            "pipeline": pipeline,
+        }
+
+    def create_merge_request(self, project: dict, spec: dict, plan: dict) -> None:
+        branch = plan["branch"]
+        sha = self.create_branch_and_commit(project, branch, spec)
 
         if self.args.dry_run:
             mr = {"iid": stable_int(f"mr-{spec['external_id']}", 50_000)}
@@ -525,48 +1089,49 @@ class GitLabSeeder:
                 "labels": ",".join(spec["labels"]),
                 "remove_source_branch": True,
             }
-            if reviewers:
-                payload["reviewer_ids"] = reviewers
+            if plan["reviewers"]:
+                payload["reviewer_ids"] = plan["reviewers"]
             mr = self.client.request(
                 "POST",
                 f"/projects/{self.encoded_project(project)}/merge_requests",
                 data=payload,
             ) or {"iid": stable_int(f"mr-{spec['external_id']}", 50_000)}
-            if state == "closed" and mr.get("iid"):
+            if plan["state"] == "closed" and mr.get("iid"):
                 self.client.request(
                     "PUT",
                     f"/projects/{self.encoded_project(project)}/merge_requests/{mr['iid']}",
                     data={"state_event": "close"},
                 )
 
-        if (
-            self.args.enable_comments
-            and self.rng.random() < arc["review_profile"]["comment_rate"]
-        ):
-            self.add_merge_request_note(project, mr["iid"], spec["arc_name"])
-        if self.args.enable_pipelines:
-            self.create_pipeline(project, branch, spec, arc)
+        if plan["comment"]:
+            self.add_merge_request_note(project, mr, spec["arc_name"])
+        if plan["pipeline"]:
+            if self.args.pipeline_mode == "statuses":
+                self.create_pipeline_statuses(
+                    project, branch, sha, spec, plan["pipeline"]
+                )
+            else:
+                self.create_pipeline(project, branch, spec, plan["pipeline"])
 
     def pick_reviewers(self, arc: dict) -> list[int]:
         if not self.reviewers:
             return []
         mean = arc["review_profile"].get("reviewer_count_mean", 1.0)
         count = max(1, min(len(self.reviewers), round(self.rng.gauss(mean, 0.5))))
-        shuffled = self.reviewers[:]
-        self.rng.shuffle(shuffled)
-        return shuffled[:count]
+        return self.rng.sample(self.reviewers, count)
 
-    def add_merge_request_note(self, project: dict, mr_iid: int, arc_name: str) -> None:
+    def add_merge_request_note(self, project: dict, mr: dict, arc_name: str) -> None:
         body = f"Seeder review note: changes were discussed during {arc_name}."
         if not self.args.dry_run:
-            self.client.request(
-                "POST",
-                f"/projects/{self.encoded_project(project)}/merge_requests/{mr_iid}/notes",
-                data={"body": body},
+            project_id = self.encoded_project(project)
+            self.queue_note(
+                f"gid://gitlab/MergeRequest/{mr['id']}" if mr.get("id") else None,
+                f"/projects/{project_id}/merge_requests/{mr['iid']}/notes",
+                body,
             )
-        self.manifest["comments"]["merge_requests"] += 1
+        self.count("comments", "merge_requests")
 
-    def create_pipeline(self, project: dict, ref: str, spec: dict, arc: dict) -> None:
+    def plan_pipeline(self, spec: dict, arc: dict) -> dict:
         success = self.rng.random() < arc["pipeline_success_rate"]
         fail_stage = ""
         status = "success"
@@ -575,12 +1140,14 @@ class GitLabSeeder:
             status = "failed"
             self.manifest["pipelines"]["failure_stage"][fail_stage] += 1
 
-        for stage in ["build", "test", "security", "deploy"]:
+        for stage in PIPELINE_JOBS:
             job_status = "failed" if stage == fail_stage else "success"
             self.manifest["pipelines"]["jobs"][stage][job_status] += 1
         self.manifest["pipelines"]["created"] += 1
         self.manifest["pipelines"]["by_arc"][spec["arc_name"]][status] += 1
+        return {"status": status, "fail_stage": fail_stage}
 
+    def create_pipeline(self, project: dict, ref: str, spec: dict, plan: dict) -> None:
         if self.args.dry_run:
             return
         self.client.request(
@@ -591,43 +1158,55 @@ class GitLabSeeder:
                 "variables": [
                     {"key": "SEED_EXTERNAL_ID", "value": spec["external_id"]},
                     {"key": "SEED_THEME", "value": spec["theme"]},
-                    {"key": "FAIL_STAGE", "value": fail_stage},
+                    {"key": "FAIL_STAGE", "value": plan["fail_stage"]},
                 ],
             },
         )
 
-    def create_release(self, project: dict, month_idx: int, arc: dict) -> None:
-        tag_name = f"seed-v{month_idx + 1}-{slug(arc['name'])}"
-        self.manifest["releases"]["created"] += 1
-        self.manifest["releases"]["by_project"][project["path"]] += 1
+    def create_pipeline_statuses(
+        self, project: dict, ref: str, sha: str | None, spec: dict, plan: dict
+    ) -> None:
+        """Record the planned job outcomes as commit statuses on the fixture commit.
+
+        GitLab groups statuses posted for the same SHA into one external
+        pipeline, so dashboards see the same build/test/security/deploy signal
+        as a real CI run without scheduling any runner jobs.
+        """
         if self.args.dry_run:
             return
+        if not sha:
+            self.log(f"No commit SHA for {ref}; skipping synthetic pipeline")
+            return
         project_id = self.encoded_project(project)
-        tag = self.client.request(
-            "GET", f"/projects/{project_id}/repository/tags/{tag_name}"
-        )
-        if not tag:
+        for stage, job_name in PIPELINE_JOBS.items():
             self.client.request(
                 "POST",
-                f"/projects/{project_id}/repository/tags",
+                f"/projects/{project_id}/statuses/{sha}",
                 data={
-                    "tag_name": tag_name,
-                    "ref": project.get("default_branch") or "main",
+                    "state": "failed" if stage == plan["fail_stage"] else "success",
+                    "ref": ref,
+                    "name": job_name,
+                    "description": f"Seeded {stage} job for {spec['external_id']}",
                 },
             )
+
+    def create_release(self, project: dict, month_idx: int, arc: dict) -> None:
+        tag_name = f"seed-v{month_idx + 1}-{slug(arc['name'])}"
+        if self.args.dry_run or tag_name in project["release_tags"]:
+            return
+        # The releases API creates the tag from ``ref`` when it does not exist yet.
         release = self.client.request(
-            "GET", f"/projects/{project_id}/releases/{tag_name}"
+            "POST",
+            f"/projects/{self.encoded_project(project)}/releases",
+            data={
+                "name": f"Seeded {arc['name']} release {month_idx + 1}",
+                "tag_name": tag_name,
+                "ref": project.get("default_branch") or "main",
+                "description": "Seeded release for Developer Health demo data.",
+            },
         )
-        if not release:
-            self.client.request(
-                "POST",
-                f"/projects/{project_id}/releases",
-                data={
-                    "name": f"Seeded {arc['name']} release {month_idx + 1}",
-                    "tag_name": tag_name,
-                    "description": "Seeded release for Developer Health demo data.",
-                },
-            )
+        if release:
+            project["release_tags"].add(tag_name)
 
     def build_issue_spec(
         self, project_spec: dict, project: dict, month_idx: int, arc: dict, idx: int
@@ -670,9 +1249,16 @@ class GitLabSeeder:
             "comment_rate": arc["review_profile"]["comment_rate"],
         }
 
-    def generate_month(
+    def plan_month(
         self, project_spec: dict, project: dict, month_idx: int, arc: dict
-    ) -> None:
+    ) -> list:
+        """Draw every random decision for a project month; return its work items.
+
+        Items are plain dicts: one per issue (with its note, merge request and
+        pipeline decisions) plus the month's release. Executing an item only
+        touches the network and thread-safe counters, so items can run in any
+        order, or be rendered into an export, without changing the output.
+        """
         if self.args.monthly_issue_count and self.args.monthly_issue_count > 0:
             issue_count = self.args.monthly_issue_count
         else:
@@ -680,25 +1266,46 @@ class GitLabSeeder:
             std = arc["monthly_issue_std"]
             issue_count = max(2, int(self.rng.gauss(mean, std)))
 
+        items = []
         for idx in range(issue_count):
             spec = self.build_issue_spec(project_spec, project, month_idx, arc, idx)
-            issue = self.create_issue(project, spec)
+            new_issue = (
+                f"extid::{spec['external_id']}"
+                not in self.existing_labels[project["path"]]
+            )
+            if new_issue and self.args.issue_import == "csv":
+                self.pending_imports[project["path"]].append(spec)
+            # Draw the note decision even for issues that already exist so a
+            # re-run keeps the same random stream as the run that created them.
+            issue_note = (
+                not self.args.dry_run
+                and self.args.enable_comments
+                and self.rng.random() < spec["comment_rate"]
+                and new_issue
+            )
+            merge_request = None
             if self.args.enable_merge_requests and self.rng.random() < arc["mr_ratio"]:
-                self.create_merge_request(project, issue, spec, arc)
+                merge_request = self.plan_merge_request(spec, arc)
+            items.append(
+                {
+                    "kind": "issue",
+                    "spec": spec,
+                    "issue_note": issue_note,
+                    "merge_request": merge_request,
+                }
+            )
 
         interval = max(1, int(arc.get("release_interval_months", 2)))
         if self.args.enable_releases and month_idx % interval == 0:
-            self.create_release(project, month_idx, arc)
-
-    def run(self) -> None:
-        self.ensure_group()
-        self.resolve_reviewers()
-        for project_spec in self.story["projects"]:
-            project = self.ensure_project(project_spec)
-            self.prefetch_existing(project)
-            self.ensure_repository_seed_files(project)
+            self.manifest["releases"]["created"] += 1
+            self.manifest["releases"]["by_project"][project["path"]] += 1
+            items.append({"kind": "release", "month_idx": month_idx, "arc": arc})
+        return items
 
+    def plan_timeline(self) -> list[tuple[int, dict, dict, list[dict]]]:
+        """Plan every month in story order as (month_idx, arc, project, items)."""
         arcs = self.story["arcs"]
+        timeline = []
         for month_idx in range(self.month_count):
             arc = next(
                 (
@@ -710,10 +1317,424 @@ class GitLabSeeder:
             )
             if not arc:
                 continue
-            self.log(f"Month {month_idx}: {arc['name']}")
             for project_spec in self.story["projects"]:
                 project = self.projects[project_spec["path"]]
-                self.generate_month(project_spec, project, month_idx, arc)
+                items = self.plan_month(project_spec, project, month_idx, arc)
+                timeline.append((month_idx, arc, project, items))
+        return timeline
+
+    def run_item(self, project: dict, item: dict) -> None:
+        if item["kind"] == "release":
+            self.create_release(project, item["month_idx"], item["arc"])
+            return
+        spec = item["spec"]
+        issue = self.create_issue(project, spec)
+        # issue_note is only planned for issues this run creates, which may
+        # already exist here when they came in through a CSV import.
+        if item["issue_note"] and not issue.get("error"):
+            self.add_issue_note(project, issue, spec["arc_name"])
+        if item["merge_request"]:
+            self.create_merge_request(project, spec, item["merge_request"])
+
+    def execute_chains(self, chains: list) -> None:
+        if self.args.concurrency <= 1 or len(chains) <= 1:
+            for chain in chains:
+                chain()
+            return
+        asyncio.run(self.execute_chains_async(chains))
+
+    async def execute_chains_async(self, chains: list) -> None:
+        """Run chains on an asyncio loop, at most ``--concurrency`` at a time."""
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.args.concurrency)
+        semaphore = asyncio.Semaphore(self.args.concurrency)
+
+        async def run_chain(chain):
+            async with semaphore:
+                await loop.run_in_executor(executor, chain)
+
+        try:
+            await asyncio.gather(*(run_chain(chain) for chain in chains))
+        finally:
+            executor.shutdown(wait=True)
+
+    def prefetch_projects(self) -> None:
+        """Load existing issues, branches and releases for all projects at once."""
+
+        def prefetch(project: dict) -> None:
+            self.prefetch_existing(project)
+            self.prefetch_branches(project)
+            self.prefetch_releases(project)
+
+        projects = list(self.projects.values())
+        workers = max(1, min(len(projects), PREFETCH_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(prefetch, projects))
+
+    def count(self, section: str, counter: str, amount: int = 1) -> None:
+        with self.manifest_lock:
+            self.manifest[section][counter] += amount
+
+    def export_projects(self) -> None:
+        """Render every story project as a GitLab export archive.
+
+        The archives hold the same plan an API run would execute, with the
+        story's historic timestamps. With ``--import-exports`` each archive is
+        then imported through ``POST /projects/import``; projects that already
+        exist are left alone, as the import API only creates new projects.
+        """
+        export_dir = Path(self.args.export_dir)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        existing = {}
+        if self.args.import_exports:
+            existing = self.graphql_projects(
+                [
+                    f"{self.args.group_path}/{project_spec['path']}"
+                    for project_spec in self.story["projects"]
+                ]
+            )
+        for project_spec in self.story["projects"]:
+            self.stub_project(project_spec)
+
+        items_by_project: dict[str, list[tuple[int, dict]]] = defaultdict(list)
+        for month_idx, _, project, items in self.plan_timeline():
+            for item in items:
+                items_by_project[project["path"]].append((month_idx, item))
+
+        for project_spec in self.story["projects"]:
+            project = self.projects[project_spec["path"]]
+            archive = export_dir / f"{project['path']}_export.tar.gz"
+            self.write_export(project, items_by_project[project["path"]], archive)
+            self.manifest["exports"]["projects"] += 1
+            self.log(f"Export written to {archive}")
+            if not self.args.import_exports:
+                continue
+            full_path = project["path_with_namespace"]
+            if full_path in existing or (
+                full_path in self.failed_lookups and self.rest_project(full_path)
+            ):
+                self.log(f"{project['path_with_namespace']} exists; skipping import")
+                self.manifest["exports"]["skipped_existing"] += 1
+                continue
+            if self.import_export(project_spec, archive):
+                self.manifest["exports"]["imported"] += 1
+            else:
+                self.manifest["exports"]["failed"] += 1
+
+    def write_export(
+        self, project: dict, planned: list[tuple[int, dict]], archive: Path
+    ) -> None:
+        """Write one project's export archive (ndjson tree plus git bundle)."""
+        default_branch = project["default_branch"]
+        commits = [
+            {
+                "ref": default_branch,
+                "parent": None,
+                "message": "seed: add fixture project files",
+                "when": self.start_date,
+                "files": {path: content for path, (content, _) in SEED_FILES.items()},
+            }
+        ]
+        tags = {}
+        for month_idx, item in planned:
+            if item["kind"] == "release":
+                tag_name = f"seed-v{month_idx + 1}-{slug(item['arc']['name'])}"
+                tags[tag_name] = default_branch
+                continue
+            merge_request = item["merge_request"]
+            if merge_request:
+                spec = item["spec"]
+                commits.append(
+                    {
+                        "ref": merge_request["branch"],
+                        "parent": default_branch,
+                        "message": f"seed: fixture change for {spec['external_id']}",
+                        "when": spec["created_at"] + dt.timedelta(days=1),
+                        "files": {
+                            f"fixtures/{spec['external_id']}.md": self.fixture_content(
+                                spec
+                            )
+                        },
+                    }
+                )
+
+        with tempfile.TemporaryDirectory() as workdir:
+            bundle_path = Path(workdir) / "project.bundle"
+            heads = write_git_bundle(bundle_path, default_branch, commits, tags)
+            relations = self.export_relations(project, planned, heads)
+            project_attributes = {
+                "description": f"Seeded Developer Health project {project['name']}",
+                "visibility_level": 0,
+                "archived": False,
+            }
+            files = {
+                "VERSION": EXPORT_VERSION,
+                "tree/project.json": json.dumps(project_attributes),
+            }
+            for relation, rows in relations.items():
+                files[f"tree/project/{relation}.ndjson"] = "".join(
+                    json.dumps(row, sort_keys=True) + "\n" for row in rows
+                )
+            mtime = int(self.start_date.replace(tzinfo=dt.UTC).timestamp())
+            with archive.open("wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", mtime=0
+            ) as zipped, tarfile.open(fileobj=zipped, mode="w") as tar:
+                members = [(name, body.encode("utf-8")) for name, body in files.items()]
+                members.append(("project.bundle", bundle_path.read_bytes()))
+                for name, data in members:
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    info.mtime = mtime
+                    info.mode = 0o644
+                    tar.addfile(info, io.BytesIO(data))
+
+    def export_relations(
+        self, project: dict, planned: list[tuple[int, dict]], heads: dict[str, str]
+    ) -> dict[str, list[dict]]:
+        """Build the ndjson relation rows for one project's export."""
+        default_branch = project["default_branch"]
+        base_sha = heads[default_branch]
+        labels: dict[str, dict] = {}
+        relations: dict[str, list[dict]] = {
+            "issues": [],
+            "merge_requests": [],
+            "ci_pipelines": [],
+            "releases": [],
+        }
+
+        def label_links(spec: dict, target_type: str) -> list[dict]:
+            links = []
+            for title in spec["labels"]:
+                label = labels.setdefault(
+                    title,
+                    {
+                        "title": title,
+                        "color": EXPORT_LABEL_COLOR,
+                        "type": "ProjectLabel",
+                    },
+                )
+                links.append({"target_type": target_type, "label": label})
+            return links
+
+        def note(body: str, noteable_type: str, when: dt.datetime) -> dict:
+            return {
+                "note": body,
+                "noteable_type": noteable_type,
+                "system": False,
+                "created_at": export_time(when),
+                "updated_at": export_time(when),
+                "author": {"name": "Dev Health Seeder"},
+            }
+
+        for month_idx, item in planned:
+            if item["kind"] == "release":
+                arc = item["arc"]
+                released_at = self.start_date + dt.timedelta(days=month_idx * 30)
+                relations["releases"].append(
+                    {
+                        "tag": f"seed-v{month_idx + 1}-{slug(arc['name'])}",
+                        "name": f"Seeded {arc['name']} release {month_idx + 1}",
+                        "description": "Seeded release for Developer Health demo data.",
+                        "sha": base_sha,
+                        "created_at": export_time(released_at),
+                        "released_at": export_time(released_at),
+                    }
+                )
+                continue
+
+            spec = item["spec"]
+            created = export_time(spec["created_at"])
+            issue = {
+                "iid": len(relations["issues"]) + 1,
+                "title": spec["title"],
+                "description": spec["description"],
+                "state": "opened",
+                "created_at": created,
+                "updated_at": created,
+                "label_links": label_links(spec, "Issue"),
+                "notes": [],
+            }
+            if item["issue_note"]:
+                body = (
+                    f"Seeder note: work progressed during the {spec['arc_name']} arc."
+                )
+                when = spec["created_at"] + dt.timedelta(days=2)
+                issue["notes"].append(note(body, "Issue", when))
+                self.count("comments", "issues")
+            relations["issues"].append(issue)
+
+            plan = item["merge_request"]
+            if not plan:
+                continue
+            opened_at = spec["created_at"] + dt.timedelta(days=1)
+            head_sha = heads[plan["branch"]]
+            fixture = self.fixture_content(spec)
+            fixture_path = f"fixtures/{spec['external_id']}.md"
+            fixture_lines = fixture.splitlines()
+            commit_message = f"seed: fixture change for {spec['external_id']}"
+            merge_request = {
+                "iid": len(relations["merge_requests"]) + 1,
+                "title": f"{spec['title']} (!seed)",
+                "description": spec["description"],
+                "source_branch": plan["branch"],
+                "target_branch": default_branch,
+                "source_branch_sha": head_sha,
+                "target_branch_sha": base_sha,
+                "state": "closed" if plan["state"] == "closed" else "opened",
+                "merge_status": "can_be_merged",
+                "created_at": export_time(opened_at),
+                "updated_at": export_time(opened_at + dt.timedelta(days=1)),
+                "label_links": label_links(spec, "MergeRequest"),
+                "notes": [],
+                "merge_request_diff": {
+                    "state": "collected",
+                    "base_commit_sha": base_sha,
+                    "start_commit_sha": base_sha,
+                    "head_commit_sha": head_sha,
+                    "created_at": export_time(opened_at),
+                    "merge_request_diff_commits": [
+                        {
+                            "sha": head_sha,
+                            "relative_order": 0,
+                            "message": commit_message,
+                            "authored_date": export_time(opened_at),
+                            "committed_date": export_time(opened_at),
+                            "commit_author": {"name": "Dev Health Seeder"},
+                        }
+                    ],
+                    "merge_request_diff_files": [
+                        {
+                            "relative_order": 0,
+                            "new_file": True,
+                            "renamed_file": False,
+                            "deleted_file": False,
+                            "new_path": fixture_path,
+                            "old_path": fixture_path,
+                            "a_mode": "0",
+                            "b_mode": "100644",
+                            "diff": f"@@ -0,0 +1,{len(fixture_lines)} @@\n"
+                            + "".join(f"+{line}\n" for line in fixture_lines),
+                        }
+                    ],
+                },
+            }
+            if plan["comment"]:
+                body = (
+                    "Seeder review note: changes were discussed during "
+                    f"{spec['arc_name']}."
+                )
+                when = opened_at + dt.timedelta(days=1)
+                merge_request["notes"].append(note(body, "MergeRequest", when))
+                self.count("comments", "merge_requests")
+            relations["merge_requests"].append(merge_request)
+
+            pipeline = plan["pipeline"]
+            if pipeline:
+                started = opened_at + dt.timedelta(minutes=5)
+                stages = []
+                for position, (stage, job_name) in enumerate(PIPELINE_JOBS.items()):
+                    status = "failed" if stage == pipeline["fail_stage"] else "success"
+                    finished = started + dt.timedelta(minutes=4 * (position + 1))
+                    stages.append(
+                        {
+                            "name": stage,
+                            "status": status,
+                            "position": position,
+                            "created_at": export_time(started),
+                            "builds": [
+                                {
+                                    "name": job_name,
+                                    "stage": stage,
+                                    "status": status,
+                                    "ref": plan["branch"],
+                                    "created_at": export_time(started),
+                                    "started_at": export_time(
+                                        finished - dt.timedelta(minutes=4)
+                                    ),
+                                    "finished_at": export_time(finished),
+                                }
+                            ],
+                        }
+                    )
+                relations["ci_pipelines"].append(
+                    {
+                        "ref": plan["branch"],
+                        "sha": head_sha,
+                        "source": "push",
+                        "status": pipeline["status"],
+                        "created_at": export_time(started),
+                        "started_at": export_time(started),
+                        "finished_at": export_time(
+                            started + dt.timedelta(minutes=4 * len(PIPELINE_JOBS))
+                        ),
+                        "stages": stages,
+                    }
+                )
+
+        relations["labels"] = list(labels.values())
+        return relations
+
+    def import_export(self, project_spec: dict, archive: Path) -> bool:
+        """Import one archive as a new project and wait for it to finish."""
+        result = self.client.request(
+            "POST",
+            "/projects/import",
+            files={
+                "path": (None, project_spec["path"]),
+                "name": (None, project_spec["name"]),
+                "namespace": (None, self.args.group_path),
+                "file": (archive.name, archive.read_bytes(), "application/gzip"),
+            },
+        )
+        if not result:
+            return False
+        deadline = time.monotonic() + self.args.import_timeout
+        status = result.get("import_status")
+        while status not in {"finished", "failed"} and time.monotonic() < deadline:
+            time.sleep(IMPORT_POLL_SECONDS)
+            state = self.client.request("GET", f"/projects/{result['id']}/import")
+            status = (state or {}).get("import_status", status)
+        if status != "finished":
+            self.log(f"Import of {archive.name} ended as {status}")
+        return status == "finished"
+
+    def seed_projects(self) -> None:
+        lookups = {}
+        if not self.args.dry_run:
+            lookups = self.graphql_projects(
+                [
+                    f"{self.args.group_path}/{project_spec['path']}"
+                    for project_spec in self.story["projects"]
+                ]
+            )
+        for project_spec in self.story["projects"]:
+            full_path = f"{self.args.group_path}/{project_spec['path']}"
+            project = self.ensure_project(project_spec, lookups.get(full_path))
+            self.ensure_repository_seed_files(project)
+        self.prefetch_projects()
+
+        timeline = self.plan_timeline()
+        if self.args.issue_import == "csv":
+            self.import_issues_csv()
+        for (month_idx, arc), planned in itertools.groupby(
+            timeline, key=lambda entry: (entry[0], entry[1]["name"])
+        ):
+            self.log(f"Month {month_idx}: {arc}")
+            chains = [
+                functools.partial(self.run_item, project, item)
+                for _, _, project, items in planned
+                for item in items
+            ]
+            self.execute_chains(chains)
+            self.flush_notes()
+
+    def run(self) -> None:
+        self.ensure_group()
+        self.resolve_reviewers()
+        if self.args.export_dir:
+            self.export_projects()
+        else:
+            self.seed_projects()
 
         manifest_path = Path(self.args.manifest)
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -740,9 +1761,20 @@ def parse_args() -> argparse.Namespace:
         "--seed", default=os.environ.get("GITLAB_SEED", "dev-health-demo")
     )
     parser.add_argument("--reviewers", default=os.environ.get("GITLAB_REVIEWERS", ""))
+    parser.add_argument(
+        "--reviewer-cache",
+        default=None,
+        help="JSON cache of reviewer user IDs (default: next to the manifest).",
+    )
     parser.add_argument(
         "--batch-size", "--batch_size", dest="batch_size", type=int, default=50
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Issue/MR/pipeline chains run at once; 1 keeps the serial engine.",
+    )
     parser.add_argument("--start-date", "--start_date", dest="start_date", default=None)
     parser.add_argument("--end-date", "--end_date", dest="end_date", default=None)
     parser.add_argument(
@@ -756,11 +1788,51 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--enable-comments", action="store_true")
     parser.add_argument("--disable-pipelines", action="store_true")
     parser.add_argument("--disable-merge-requests", action="store_true")
+    parser.add_argument(
+        "--note-batch-size",
+        type=int,
+        default=20,
+        help="createNote mutations per GraphQL request; 1 posts each note over REST.",
+    )
+    parser.add_argument(
+        "--issue-import",
+        choices=["api", "csv"],
+        default="api",
+        help="api creates issues one by one; csv uploads one CSV per project.",
+    )
+    parser.add_argument(
+        "--import-timeout",
+        type=float,
+        default=600.0,
+        help="Seconds to wait for CSV-imported issues to appear.",
+    )
+    parser.add_argument(
+        "--export-dir",
+        default=None,
+        help="Write one GitLab project export archive per project here "
+        "instead of seeding through the API.",
+    )
+    parser.add_argument(
+        "--import-exports",
+        action="store_true",
+        help="Import the written archives as new projects via POST /projects/import.",
+    )
+    parser.add_argument(
+        "--pipeline-mode",
+        choices=["ci", "statuses"],
+        default="ci",
+        help="ci triggers real pipelines; statuses posts synthetic commit statuses.",
+    )
     parser.add_argument("--disable-releases", action="store_true")
     args = parser.parse_args()
 
     args.token = os.environ.get("GITLAB_TOKEN")
-    if not args.dry_run and not args.token:
+    if args.export_dir and args.dry_run:
+        parser.error("--export-dir already runs offline; drop --dry-run")
+    if args.import_exports and not args.export_dir:
+        parser.error("--import-exports requires --export-dir")
+    offline = args.dry_run or (args.export_dir and not args.import_exports)
+    if not offline and not args.token:
         raise ValueError(
             "GITLAB_TOKEN environment variable is required outside dry-run"
         )
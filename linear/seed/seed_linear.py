@@ -9,10 +9,11 @@ import hashlib
 import json
 import os
 import random
+import re
 import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import requests
 import yaml
@@ -26,6 +27,9 @@ CANONICAL_THEMES = {
     "Quality / Reliability",
     "Risk / Security",
 }
+CYCLE_FIELDS = "id name number startsAt endsAt"
+EXTERNAL_ID_TITLE = re.compile(r"^\[([0-9a-f]{12})\] ")
+LABEL_FIELDS = "id name"
 LABEL_COLORS = {
     "Feature Delivery": "#5E6AD2",
     "Operational / Support": "#F2C94C",
@@ -70,6 +74,11 @@ def pick_weighted(rng: random.Random, weights: dict[Any, float]) -> Any:
     return rng.choices(keys, weights=vals, k=1)[0]
 
 
+def title_external_id(title: str) -> str | None:
+    match = EXTERNAL_ID_TITLE.match(title)
+    return match.group(1) if match else None
+
+
 def priority_name(priority: int) -> str:
     return {1: "urgent", 2: "high", 3: "normal", 4: "low"}.get(priority, "none")
 
@@ -125,170 +134,165 @@ class LinearClient:
             return data.get("data", {})
         raise RuntimeError("Linear GraphQL request failed after 3 attempts")
 
-    def find_team(self, key: str) -> dict[str, Any] | None:
-        query = """
-        query TeamByKey($key: String!) {
-          teams(filter: { key: { eq: $key } }, first: 1) {
-            nodes { id key name }
-          }
-        }
-        """
-        data = self.graphql(query, {"key": key})
-        nodes = data.get("teams", {}).get("nodes", [])
-        return nodes[0] if nodes else None
-
-    def create_team(self, key: str, name: str, description: str) -> dict[str, Any]:
-        mutation = """
-        mutation CreateTeam($input: TeamCreateInput!) {
-          teamCreate(input: $input) {
-            success
-            team { id key name }
-          }
-        }
+    def paginate(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        *path: str,
+        after: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Follow ``pageInfo`` cursors on the connection found at ``path``."""
+        nodes: list[dict[str, Any]] = []
+        while True:
+            connection = self.graphql(query, {**variables, "after": after})
+            for key in path:
+                connection = connection.get(key) or {}
+            nodes.extend(connection.get("nodes", []))
+            page_info = connection.get("pageInfo", {})
+            if not page_info.get("hasNextPage"):
+                return nodes
+            after = page_info.get("endCursor")
+
+    def fetch_structure(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Return every team, with its labels and cycles, and every project."""
+        teams_query = f"""
+        query StructureTeams($after: String) {{
+          teams(first: 10, after: $after) {{
+            nodes {{
+              id key name
+              labels(first: 100) {{
+                nodes {{ {LABEL_FIELDS} }}
+                pageInfo {{ hasNextPage endCursor }}
+              }}
+              cycles(first: 100) {{
+                nodes {{ {CYCLE_FIELDS} }}
+                pageInfo {{ hasNextPage endCursor }}
+              }}
+            }}
+            pageInfo {{ hasNextPage endCursor }}
+          }}
+        }}
         """
-        if self.dry_run:
-            return {"id": f"team-{key}", "key": key, "name": name}
-        data = self.graphql(
-            mutation,
-            {"input": {"key": key, "name": name, "description": description}},
-            write=True,
-        )
-        return data["teamCreate"]["team"]
-
-    def find_project(self, name: str) -> dict[str, Any] | None:
-        query = """
-        query ProjectByName($name: String!) {
-          projects(filter: { name: { eq: $name } }, first: 1) {
+        projects_query = """
+        query StructureProjects($after: String) {
+          projects(first: 250, after: $after) {
             nodes { id name }
+            pageInfo { hasNextPage endCursor }
           }
         }
         """
-        data = self.graphql(query, {"name": name})
-        nodes = data.get("projects", {}).get("nodes", [])
-        return nodes[0] if nodes else None
+        teams = self.paginate(teams_query, {}, "teams")
+        for team in teams:
+            for field, fields in (("labels", LABEL_FIELDS), ("cycles", CYCLE_FIELDS)):
+                connection = team.get(field) or {}
+                nodes = connection.get("nodes", [])
+                page_info = connection.get("pageInfo", {})
+                if page_info.get("hasNextPage"):
+                    # Rare: more than one nested page, so continue on the team.
+                    query = f"""
+                    query Team{field.title()}($teamId: String!, $after: String) {{
+                      team(id: $teamId) {{
+                        {field}(first: 100, after: $after) {{
+                          nodes {{ {fields} }}
+                          pageInfo {{ hasNextPage endCursor }}
+                        }}
+                      }}
+                    }}
+                    """
+                    nodes = nodes + self.paginate(
+                        query,
+                        {"teamId": team["id"]},
+                        "team",
+                        field,
+                        after=page_info.get("endCursor"),
+                    )
+                team[field] = nodes
+        return teams, self.paginate(projects_query, {}, "projects")
 
-    def create_project(
-        self,
-        name: str,
-        team_id: str,
-        description: str,
-    ) -> dict[str, Any]:
-        mutation = """
-        mutation CreateProject($input: ProjectCreateInput!) {
-          projectCreate(input: $input) {
-            success
-            project { id name }
-          }
-        }
-        """
+    def create_teams(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if self.dry_run:
-            return {"id": f"project-{stable_hash(name)}", "name": name}
-        data = self.graphql(
-            mutation,
-            {
-                "input": {
-                    "name": name,
-                    "description": description,
-                    "teamIds": [team_id],
-                }
-            },
-            write=True,
+            return [
+                {"id": f"team-{item['key']}", "key": item["key"], "name": item["name"]}
+                for item in inputs
+            ]
+        results = self.create_aliased(
+            "CreateTeams",
+            "teamCreate",
+            "TeamCreateInput",
+            "success team { id key name }",
+            inputs,
         )
-        return data["projectCreate"]["project"]
-
-    def find_label(self, team_id: str, name: str) -> dict[str, Any] | None:
-        query = """
-        query LabelByName($teamId: ID!, $name: String!) {
-          issueLabels(
-            filter: { team: { id: { eq: $teamId } }, name: { eq: $name } }
-            first: 1
-          ) {
-            nodes { id name }
-          }
-        }
-        """
-        data = self.graphql(query, {"teamId": team_id, "name": name})
-        nodes = data.get("issueLabels", {}).get("nodes", [])
-        return nodes[0] if nodes else None
+        return [result["team"] for result in results]
 
-    def create_label(self, team_id: str, name: str, color: str) -> dict[str, Any]:
-        mutation = """
-        mutation CreateLabel($input: IssueLabelCreateInput!) {
-          issueLabelCreate(input: $input) {
-            success
-            issueLabel { id name }
-          }
-        }
-        """
+    def create_projects(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if self.dry_run:
-            return {"id": f"label-{stable_hash(team_id + name)}", "name": name}
-        data = self.graphql(
-            mutation,
-            {"input": {"teamId": team_id, "name": name, "color": color}},
-            write=True,
+            return [
+                {"id": f"project-{stable_hash(item['name'])}", "name": item["name"]}
+                for item in inputs
+            ]
+        results = self.create_aliased(
+            "CreateProjects",
+            "projectCreate",
+            "ProjectCreateInput",
+            "success project { id name }",
+            inputs,
         )
-        return data["issueLabelCreate"]["issueLabel"]
+        return [result["project"] for result in results]
 
-    def find_cycle(self, team_id: str, name: str) -> dict[str, Any] | None:
-        query = """
-        query CycleByName($teamId: ID!, $name: String!) {
-          cycles(
-            filter: { team: { id: { eq: $teamId } }, name: { eq: $name } }
-            first: 1
-          ) {
-            nodes { id name number startsAt endsAt }
-          }
-        }
-        """
-        data = self.graphql(query, {"teamId": team_id, "name": name})
-        nodes = data.get("cycles", {}).get("nodes", [])
-        return nodes[0] if nodes else None
+    def create_labels(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.dry_run:
+            return [
+                {
+                    "id": f"label-{stable_hash(item['teamId'] + item['name'])}",
+                    "name": item["name"],
+                }
+                for item in inputs
+            ]
+        results = self.create_aliased(
+            "CreateLabels",
+            "issueLabelCreate",
+            "IssueLabelCreateInput",
+            f"success issueLabel {{ {LABEL_FIELDS} }}",
+            inputs,
+        )
+        return [result["issueLabel"] for result in results]
 
-    def create_cycle(
-        self,
-        team_id: str,
-        name: str,
-        starts_at: dt.datetime,
-        ends_at: dt.datetime,
-    ) -> dict[str, Any]:
-        mutation = """
-        mutation CreateCycle($input: CycleCreateInput!) {
-          cycleCreate(input: $input) {
-            success
-            cycle { id name number startsAt endsAt }
-          }
-        }
-        """
+    def create_cycles(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if self.dry_run:
-            return {"id": f"cycle-{stable_hash(team_id + name)}", "name": name}
-        data = self.graphql(
-            mutation,
-            {
-                "input": {
-                    "teamId": team_id,
-                    "name": name,
-                    "startsAt": starts_at.date().isoformat(),
-                    "endsAt": ends_at.date().isoformat(),
+            return [
+                {
+                    "id": f"cycle-{stable_hash(item['teamId'] + item['name'])}",
+                    "name": item["name"],
                 }
-            },
-            write=True,
+                for item in inputs
+            ]
+        results = self.create_aliased(
+            "CreateCycles",
+            "cycleCreate",
+            "CycleCreateInput",
+            f"success cycle {{ {CYCLE_FIELDS} }}",
+            inputs,
         )
-        return data["cycleCreate"]["cycle"]
+        return [result["cycle"] for result in results]
 
-    def find_issue(self, team_id: str, external_id: str) -> dict[str, Any] | None:
+    def list_labeled_issues(self, team_id: str, label_id: str) -> list[dict[str, Any]]:
+        """Page through a team's issues carrying ``label_id`` (id and title only)."""
         query = """
-        query IssueByExternalId($teamId: ID!, $needle: String!) {
+        query LabeledIssues($teamId: ID!, $labelId: ID!, $after: String) {
           issues(
-            filter: { team: { id: { eq: $teamId } }, title: { contains: $needle } }
-            first: 1
+            filter: {
+              team: { id: { eq: $teamId } }
+              labels: { id: { eq: $labelId } }
+            }
+            first: 250
+            after: $after
           ) {
-            nodes { id identifier title }
+            nodes { id title }
+            pageInfo { hasNextPage endCursor }
           }
         }
         """
-        data = self.graphql(query, {"teamId": team_id, "needle": external_id})
-        nodes = data.get("issues", {}).get("nodes", [])
-        return nodes[0] if nodes else None
+        return self.paginate(query, {"teamId": team_id, "labelId": label_id}, "issues")
 
     def create_issue(self, payload: dict[str, Any]) -> dict[str, Any]:
         mutation = """
@@ -308,23 +312,58 @@ class LinearClient:
         data = self.graphql(mutation, {"input": payload}, write=True)
         return data["issueCreate"]["issue"]
 
-    def create_comment(self, issue_id: str, body: str) -> dict[str, Any]:
-        mutation = """
-        mutation CreateComment($input: CommentCreateInput!) {
-          commentCreate(input: $input) {
-            success
-            comment { id }
-          }
-        }
+    def create_aliased(
+        self,
+        name: str,
+        field: str,
+        input_type: str,
+        selection: str,
+        inputs: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Run one ``field(input:)`` mutation per input as aliases of one document.
+
+        Linear's mutation payloads are non-null, so a failing alias fails the
+        whole document and ``graphql`` raises; otherwise the payloads are
+        returned in input order.
         """
-        if self.dry_run:
-            return {"id": f"comment-{stable_hash(issue_id + body)}"}
+        if not inputs:
+            return []
+        declarations = ", ".join(
+            f"$in{idx}: {input_type}!" for idx in range(len(inputs))
+        )
+        fields = "\n".join(
+            f"  a{idx}: {field}(input: $in{idx}) {{ {selection} }}"
+            for idx in range(len(inputs))
+        )
         data = self.graphql(
-            mutation,
-            {"input": {"issueId": issue_id, "body": body}},
+            f"mutation {name}({declarations}) {{\n{fields}\n}}",
+            {f"in{idx}": value for idx, value in enumerate(inputs)},
             write=True,
         )
-        return data["commentCreate"]["comment"]
+        return [data[f"a{idx}"] for idx in range(len(inputs))]
+
+    def create_issues(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.dry_run:
+            return [self.create_issue(payload) for payload in payloads]
+        results = self.create_aliased(
+            "CreateIssues",
+            "issueCreate",
+            "IssueCreateInput",
+            "success issue { id identifier title }",
+            payloads,
+        )
+        return [result["issue"] for result in results]
+
+    def create_comments(self, comments: list[tuple[str, str]]) -> None:
+        if self.dry_run:
+            return
+        self.create_aliased(
+            "CreateComments",
+            "commentCreate",
+            "CommentCreateInput",
+            "success comment { id }",
+            [{"issueId": issue_id, "body": body} for issue_id, body in comments],
+        )
 
     def find_user_by_email(self, email: str) -> dict[str, Any] | None:
         query = """
@@ -355,10 +394,15 @@ class LinearSeeder:
         self.teams: dict[str, dict[str, Any]] = {}
         self.projects: dict[str, dict[str, Any]] = {}
         self.labels_by_team: dict[str, dict[str, str]] = defaultdict(dict)
+        self.cycles_by_team_name: dict[str, dict[str, dict[str, Any]]] = defaultdict(
+            dict
+        )
         self.cycles_by_team_month: dict[str, dict[int, dict[str, Any]]] = defaultdict(
             dict
         )
         self.assignees: list[dict[str, Any]] = []
+        self.existing_issues: dict[str, dict[str, Any]] = {}
+        self.pending_issues: list[tuple[dict[str, Any], dict[str, Any], bool]] = []
         self.sample_issues: list[dict[str, Any]] = []
 
         self.manifest: dict[str, Any] = {
@@ -378,6 +422,7 @@ class LinearSeeder:
                 "issues_created": 0,
                 "issues_skipped_existing": 0,
                 "comments": 0,
+                "comments_failed": 0,
                 "by_theme": defaultdict(int),
                 "by_team": defaultdict(int),
                 "by_month": defaultdict(int),
@@ -423,32 +468,106 @@ class LinearSeeder:
         self.client.log(message)
 
     def ensure_structure(self) -> None:
-        for team in self.story["teams"]:
-            existing = self.client.find_team(team["key"])
-            created = existing or self.client.create_team(
-                team["key"],
-                team["name"],
-                f"Seeded Developer Health fixture team for {team['domain']}.",
-            )
-            self.teams[team["key"]] = created
-            self.manifest["counts"]["teams"] += int(existing is None)
+        """Load the workspace structure in one pass, then create what is missing."""
+        teams, projects = self.client.fetch_structure()
+        teams_by_key = {team["key"]: team for team in teams}
+        projects_by_name = {project["name"]: project for project in projects}
 
+        missing_teams = [
+            team for team in self.story["teams"] if team["key"] not in teams_by_key
+        ]
+        created_teams = self.create_in_batches(
+            self.client.create_teams,
+            [
+                {
+                    "key": team["key"],
+                    "name": team["name"],
+                    "description": (
+                        f"Seeded Developer Health fixture team for {team['domain']}."
+                    ),
+                }
+                for team in missing_teams
+            ],
+        )
+        for team, created in zip(missing_teams, created_teams):
+            teams_by_key[team["key"]] = created
+        self.manifest["counts"]["teams"] += len(missing_teams)
+        for team in self.story["teams"]:
+            team_obj = teams_by_key[team["key"]]
+            self.teams[team["key"]] = team_obj
+            for label in team_obj.get("labels", []):
+                self.labels_by_team[team["key"]][label["name"]] = label["id"]
+            for cycle in team_obj.get("cycles", []):
+                self.cycles_by_team_name[team["key"]][cycle["name"]] = cycle
+
+        missing_projects = [
+            project
+            for project in self.story["projects"]
+            if project["name"] not in projects_by_name
+        ]
+        created_projects = self.create_in_batches(
+            self.client.create_projects,
+            [
+                {
+                    "name": project["name"],
+                    "description": project.get("description", ""),
+                    "teamIds": [self.teams[project["team_key"]]["id"]],
+                }
+                for project in missing_projects
+            ],
+        )
+        for project, created in zip(missing_projects, created_projects):
+            projects_by_name[project["name"]] = created
+        self.manifest["counts"]["projects"] += len(missing_projects)
         for project in self.story["projects"]:
-            team_id = self.teams[project["team_key"]]["id"]
-            existing = self.client.find_project(project["name"])
-            created = existing or self.client.create_project(
-                project["name"], team_id, project.get("description", "")
-            )
-            self.projects[project["name"]] = created
-            self.manifest["counts"]["projects"] += int(existing is None)
+            self.projects[project["name"]] = projects_by_name[project["name"]]
 
-        for team_key, team_obj in self.teams.items():
-            for label in ["seeded", *sorted(CANONICAL_THEMES)]:
-                found = self.client.find_label(team_obj["id"], label)
-                created = found or self.client.create_label(
-                    team_obj["id"], label, LABEL_COLORS.get(label, "#888888")
-                )
-                self.labels_by_team[team_key][label] = created["id"]
+        missing_labels = [
+            (team_key, label)
+            for team_key in self.teams
+            for label in ["seeded", *sorted(CANONICAL_THEMES)]
+            if label not in self.labels_by_team[team_key]
+        ]
+        created_labels = self.create_in_batches(
+            self.client.create_labels,
+            [
+                {
+                    "teamId": self.teams[team_key]["id"],
+                    "name": label,
+                    "color": LABEL_COLORS.get(label, "#888888"),
+                }
+                for team_key, label in missing_labels
+            ],
+        )
+        for (team_key, label), created in zip(missing_labels, created_labels):
+            self.labels_by_team[team_key][label] = created["id"]
+
+    def create_in_batches(
+        self,
+        create: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+        inputs: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Call a batch ``create`` method on ``--batch-size`` inputs at a time."""
+        size = max(1, self.args.batch_size)
+        created: list[dict[str, Any]] = []
+        for start in range(0, len(inputs), size):
+            created.extend(create(inputs[start : start + size]))
+        return created
+
+    def prefetch_issues(self) -> None:
+        for team_key in self.teams:
+            self.index_team_issues(team_key)
+        if self.existing_issues:
+            self.log(f"Found {len(self.existing_issues)} existing seeded issues")
+
+    def index_team_issues(self, team_key: str) -> None:
+        """Index a team's seeded issues by the external ID in their title prefix."""
+        team_id = self.teams[team_key]["id"]
+        label_id = self.labels_by_team[team_key]["seeded"]
+        for issue in self.client.list_labeled_issues(team_id, label_id):
+            external_id = title_external_id(issue["title"])
+            if external_id:
+                self.existing_issues[external_id] = issue
 
     def resolve_assignees(self) -> None:
         emails = [e.strip() for e in self.args.assignees.split(",") if e.strip()]
@@ -463,19 +582,34 @@ class LinearSeeder:
     def build_cycles(self) -> None:
         if not self.args.enable_cycles:
             return
+        planned: list[tuple[str, int, str]] = []
+        missing: dict[tuple[str, str], dict[str, Any]] = {}
         for team_key, team_obj in self.teams.items():
+            existing = self.cycles_by_team_name[team_key]
             for month_idx in range(self.month_count):
                 for half in range(2):
                     cycle_idx = month_idx * 2 + half
                     starts_at = self.start_date + dt.timedelta(days=cycle_idx * 14)
                     ends_at = starts_at + dt.timedelta(days=13)
                     name = f"DH Seed {month_key(starts_at)}-{half + 1}"
-                    existing = self.client.find_cycle(team_obj["id"], name)
-                    cycle = existing or self.client.create_cycle(
-                        team_obj["id"], name, starts_at, ends_at
-                    )
-                    self.cycles_by_team_month[team_key][cycle_idx] = cycle
-                    self.manifest["counts"]["cycles"] += int(existing is None)
+                    planned.append((team_key, cycle_idx, name))
+                    if name in existing or (team_key, name) in missing:
+                        continue
+                    missing[(team_key, name)] = {
+                        "teamId": team_obj["id"],
+                        "name": name,
+                        "startsAt": starts_at.date().isoformat(),
+                        "endsAt": ends_at.date().isoformat(),
+                    }
+        created = self.create_in_batches(
+            self.client.create_cycles, list(missing.values())
+        )
+        for (team_key, name), cycle in zip(missing, created):
+            self.cycles_by_team_name[team_key][name] = cycle
+        self.manifest["counts"]["cycles"] += len(missing)
+        for team_key, cycle_idx, name in planned:
+            cycle = self.cycles_by_team_name[team_key][name]
+            self.cycles_by_team_month[team_key][cycle_idx] = cycle
 
     def arc_for_month(self, month_idx: int) -> dict[str, Any] | None:
         return next(
@@ -600,21 +734,78 @@ class LinearSeeder:
             )
 
     def seed_issue(self, spec: dict[str, Any], issue_number: int) -> None:
-        team_id = self.teams[spec["team_key"]]["id"]
-        existing = self.client.find_issue(team_id, spec["external_id"])
-        if existing:
-            self.record_spec(spec, created=False, skipped=True)
-            return
-        issue = self.client.create_issue(self.issue_payload(spec))
-        self.record_spec(spec, created=True)
-        if self.args.enable_comments and self.rng.random() <= self.arc_for_comment_rate(
-            spec
-        ):
-            self.client.create_comment(issue["id"], spec["comment"])
-            self.manifest["counts"]["comments"] += 1
+        # Draw the assignee and comment decision even for issues that already
+        # exist so a re-run keeps the RNG stream, and therefore every later
+        # spec, identical to the first run.
+        payload = self.issue_payload(spec)
+        comment = self.args.enable_comments and self.rng.random() <= (
+            self.arc_for_comment_rate(spec)
+        )
+        self.pending_issues.append((spec, payload, comment))
         if issue_number % max(1, self.args.batch_size) == 0:
+            self.flush_issues()
             self.log(f"Processed {issue_number} issues")
 
+    def flush_issues(self) -> None:
+        """Create the buffered issues in one request, then their comments in one."""
+        pending, self.pending_issues = self.pending_issues, []
+        to_create = [
+            entry
+            for entry in pending
+            if entry[0]["external_id"] not in self.existing_issues
+        ]
+        created: dict[str, dict[str, Any]] = {}
+        if to_create:
+            try:
+                issues = self.client.create_issues([entry[1] for entry in to_create])
+            except RuntimeError as exc:
+                self.log(
+                    f"Batch of {len(to_create)} issues failed, retrying one at a time: "
+                    f"{str(exc)[:300]}"
+                )
+                issues = self.recover_issues(to_create)
+            for (spec, _, _), issue in zip(to_create, issues):
+                created[spec["external_id"]] = issue
+
+        comments = []
+        for spec, _, comment in pending:
+            issue = created.get(spec["external_id"])
+            if issue is None:
+                self.record_spec(spec, created=False, skipped=True)
+                continue
+            self.existing_issues[spec["external_id"]] = issue
+            self.record_spec(spec, created=True)
+            if comment:
+                comments.append((issue["id"], spec["comment"]))
+        try:
+            self.client.create_comments(comments)
+        except RuntimeError as exc:
+            # Aliases ahead of the failing one may already be written and
+            # comments cannot be looked up by external id, so none are resent.
+            self.log(
+                f"Batch of {len(comments)} comments failed; not resending: "
+                f"{str(exc)[:300]}"
+            )
+            self.manifest["counts"]["comments_failed"] += len(comments)
+            return
+        self.manifest["counts"]["comments"] += len(comments)
+
+    def recover_issues(
+        self, entries: list[tuple[dict[str, Any], dict[str, Any], bool]]
+    ) -> list[dict[str, Any]]:
+        """Create ``entries`` individually after their batch failed.
+
+        Aliases ahead of the failing one may already have been written, so the
+        affected teams are re-indexed first and only missing issues are sent.
+        """
+        for team_key in sorted({spec["team_key"] for spec, _, _ in entries}):
+            self.index_team_issues(team_key)
+        return [
+            self.existing_issues.get(spec["external_id"])
+            or self.client.create_issue(payload)
+            for spec, payload, _ in entries
+        ]
+
     def arc_for_comment_rate(self, spec: dict[str, Any]) -> float:
         arc = next(a for a in self.story["arcs"] if a["name"] == spec["arc"])
         return float(arc.get("comment_rate", 0.0))
@@ -642,6 +833,7 @@ class LinearSeeder:
                     issue_number += 1
                     spec = self.make_issue_spec(team, project, month_idx, item_idx, arc)
                     self.seed_issue(spec, issue_number)
+        self.flush_issues()
 
     def run(self) -> None:
         self.log(
@@ -650,6 +842,7 @@ class LinearSeeder:
             else "Writing to Linear"
         )
         self.ensure_structure()
+        self.prefetch_issues()
         self.resolve_assignees()
         self.build_cycles()
         self.generate_issues()